@@ -1,10 +1,18 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 import logging
 from datetime import datetime, timedelta
 import re
-from collections import Counter
+import copy
+import functools
+import hashlib
+import itertools
+import pickle
+import sys
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from operator import itemgetter
 
 # Configure logging
 logging.basicConfig(
@@ -13,137 +21,404 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def analyze_hiring_trends(processed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+# Keyword groups used to classify roles and locations
+LEADERSHIP_TITLES = ("CEO", "CFO", "CTO", "COO", "CHRO", "CMO", "President", "Director", "VP", "Head")
+
+TECH_CATEGORIES = {
+    "AI/ML": ["AI", "Machine Learning", "Data Scientist", "NLP", "Computer Vision", "Deep Learning"],
+    "Cloud": ["AWS", "Azure", "GCP", "Cloud", "DevOps", "SRE", "Kubernetes"],
+    "Mobile": ["iOS", "Android", "Mobile", "React Native", "Flutter"],
+    "Frontend": ["Frontend", "UI", "UX", "React", "Angular", "Vue"],
+    "Backend": ["Backend", "API", "Microservices", "Node.js", "Java", "Python", "Go", "Ruby"]
+}
+
+ROLE_CATEGORIES = {
+    "Engineering": ["Engineer", "Developer", "Programmer", "Architect"],
+    "Data": ["Data", "Analytics", "Scientist", "Analyst"],
+    "Product": ["Product", "Manager", "Owner"],
+    "Design": ["Design", "UX", "UI", "User Experience"],
+    "Marketing": ["Marketing", "Growth", "SEO", "Content"],
+    "Sales": ["Sales", "Account", "Business Development"],
+    "Operations": ["Operations", "Support", "Customer Success"]
+}
+
+REGIONS = {
+    "North America": ["US", "USA", "United States", "Canada", "Mexico"],
+    "Europe": ["UK", "United Kingdom", "Germany", "France", "Spain", "Italy", "Netherlands", "Sweden"],
+    "Asia": ["China", "Japan", "India", "Singapore", "Hong Kong"],
+    "Latin America": ["Brazil", "Argentina", "Colombia", "Chile", "Peru"]
+}
+
+GEOGRAPHIC_REGIONS = {
+    **REGIONS,
+    "Africa": ["South Africa", "Nigeria", "Kenya", "Egypt"],
+    "Australia/Oceania": ["Australia", "New Zealand"]
+}
+
+SHIFT_REGIONS = {
+    **REGIONS,
+    "Remote": ["Remote", "Virtual", "Work from home", "WFH"]
+}
+
+def _build_keyword_matcher(categories: Dict[str, List[str]]) -> Tuple[re.Pattern, Dict[str, int]]:
     """
-    Analyze hiring trends from processed job data.
+    Compile a category keyword map into a single case-insensitive matcher.
+    
+    All keywords are joined longest-first into one lookahead alternation, so a
+    single regex scan finds a keyword at every position of the text. Category i
+    is encoded as bit i, and each keyword carries the bits of every keyword that
+    is a prefix of it, which accounts for shorter keywords shadowed at the same
+    position.
     
     Args:
-        processed_data: Processed job data
+        categories: Dictionary mapping category names to keyword lists
     
     Returns:
-        List of hiring trend insights
+        Tuple of (compiled pattern, keyword to category bitmask mapping)
     """
-    logger.info("Analyzing hiring trends")
+    keyword_bits = {}
+    for bit, keywords in enumerate(categories.values()):
+        for keyword in keywords:
+            keyword_bits[keyword.lower()] = keyword_bits.get(keyword.lower(), 0) | (1 << bit)
     
-    try:
-        insights = []
+    ordered_keywords = sorted(keyword_bits, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in ordered_keywords) + "))")
+    
+    keyword_masks = {}
+    for keyword in ordered_keywords:
+        mask = 0
+        for other, other_bits in keyword_bits.items():
+            if keyword.startswith(other):
+                mask |= other_bits
+        keyword_masks[keyword] = mask
+    
+    return pattern, keyword_masks
+
+def _match_mask(text: str, matcher: Tuple[re.Pattern, Dict[str, int]]) -> int:
+    """
+    Classify text as a bitmask of every category with a keyword contained in it.
+    
+    Args:
+        text: Text to classify (role title, location, etc.)
+        matcher: Matcher built by _build_keyword_matcher
+    
+    Returns:
+        Bitmask where bit i is set if the i-th category matched
+    """
+    pattern, keyword_masks = matcher
+    mask = 0
+    for match in pattern.finditer(text.lower()):
+        mask |= keyword_masks[match.group(1)]
+    return mask
+
+def _flatten_company_counts(counts_by_company: Dict[str, Dict[str, int]], key: str) -> pd.DataFrame:
+    """
+    Flatten a nested company -> {item: count} mapping into a long-format DataFrame.
+    
+    The company and item columns are categorical, so groupby operations work on
+    integer codes rather than hashing repeated strings. Group with observed=True.
+    
+    Args:
+        counts_by_company: Dictionary mapping company names to item counts
+        key: Column name for the inner items (e.g. "skill", "location")
+    
+    Returns:
+        DataFrame with columns company, key and count
+    """
+    rows = [(company, item, count) 
+            for company, counts in counts_by_company.items() 
+            for item, count in counts.items()]
+    return pd.DataFrame(rows, columns=["company", key, "count"]).astype(
+        {"company": "category", key: "category", "count": "int64"})
+
+def _velocity_matrix(velocity_data: List[Dict[str, Any]], companies: List[str]) -> np.ndarray:
+    """
+    Build a (periods x companies) matrix of job counts from hiring velocity rows.
+    
+    Args:
+        velocity_data: List of per-period dictionaries mapping companies to job counts
+        companies: Company names, in column order
+    
+    Returns:
+        Float array of shape (len(velocity_data), len(companies))
+    """
+    return np.array([[data.get(company, 0) for company in companies] for data in velocity_data], 
+                    dtype=np.float64).reshape(len(velocity_data), len(companies))
+
+def _period_percent_changes(velocity: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compare the recent half of a velocity matrix against the earlier half.
+    
+    Args:
+        velocity: Matrix built by _velocity_matrix
+    
+    Returns:
+        Tuple of (percent change per company, mask of companies with earlier jobs)
+    """
+    # Split the data into two halves to compare recent vs earlier
+    half_point = velocity.shape[0] // 2
+    recent_counts = velocity[half_point:].sum(axis=0)
+    earlier_counts = velocity[:half_point].sum(axis=0)
+    
+    has_history = earlier_counts > 0
+    percent_changes = np.divide(recent_counts - earlier_counts, earlier_counts, 
+                                out=np.zeros_like(earlier_counts), where=has_history) * 100
+    return percent_changes, has_history
+
+def _compile_keyword_patterns(categories: Dict[str, List[str]]) -> Dict[str, re.Pattern]:
+    """
+    Compile one alternation pattern per category for matching lowercased text.
+    
+    Args:
+        categories: Dictionary mapping category names to keyword lists
+    
+    Returns:
+        Dictionary mapping category names to compiled patterns
+    """
+    return {category: re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords))
+            for category, keywords in categories.items()}
+
+def _first_insights_by_industry(insights_df: pd.DataFrame) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Reduce a tidy insights frame to the first insight of each type per industry.
+    
+    Args:
+        insights_df: DataFrame with one insight per row and "industry" and "type" columns
+    
+    Returns:
+        Dictionary mapping industries to lists of insights, one per type
+    """
+    industry_insights = {}
+    first_insights = insights_df.groupby(["industry", "type"], sort=False).head(1)
+    for record in first_insights.to_dict(orient="records"):
+        # Drop payload columns that belong to other insight types
+        insight = {key: value for key, value in record.items() if not (np.isscalar(value) and pd.isna(value))}
+        # Frames are often loaded from storage, so intern types to match the analyzers' literals
+        insight["type"] = sys.intern(insight["type"])
+        industry_insights.setdefault(record["industry"], []).append(insight)
+    return industry_insights
+
+def _most_common_value(values: List[Any]) -> Tuple[Any, int]:
+    """
+    Find the most frequent value and its count, preferring the first seen on ties.
+    
+    Args:
+        values: Non-empty list of hashable values
+    
+    Returns:
+        Tuple of (most common value, number of occurrences)
+    """
+    counts = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    
+    # First value seen wins ties
+    top_value = max(counts, key=counts.get)
+    return top_value, counts[top_value]
+
+def _memoize_analysis(maxsize: int = 32):
+    """
+    Cache analysis results keyed on a content fingerprint of the arguments.
+    
+    The fingerprint hashes the pickled arguments, so equal inputs built in the
+    same order hit the cache even when they are new objects (e.g. on every
+    dashboard rerun). Results are deep-copied so callers can mutate them freely.
+    
+    Args:
+        maxsize: Maximum number of cached results, evicted least recently used
+    
+    Returns:
+        Decorator for analysis functions
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
         
-        # Analyze hiring velocity
-        if "hiring_velocity" in processed_data:
-            velocity_data = processed_data["hiring_velocity"]
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                payload = pickle.dumps((args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                return func(*args, **kwargs)
+            key = hashlib.blake2b(payload, digest_size=16).digest()
             
-            # Split the data into two halves to compare recent vs earlier
-            half_point = len(velocity_data) // 2
-            recent_data = velocity_data[half_point:]
-            earlier_data = velocity_data[:half_point]
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return copy.deepcopy(cache[key])
             
-            for company in processed_data["companies"]:
-                # Calculate total jobs in each period
-                recent_count = sum(data[company] for data in recent_data if company in data)
-                earlier_count = sum(data[company] for data in earlier_data if company in data)
-                
-                if earlier_count > 0:
-                    percent_change = ((recent_count - earlier_count) / earlier_count) * 100
-                    
-                    if percent_change > 30:
-                        insights.append({
-                            "type": "hiring_surge",
-                            "company": company,
-                            "percent_change": percent_change,
-                            "insight": f"Hiring surge detected: {company} has increased hiring by {percent_change:.1f}% compared to the previous period."
-                        })
-                    elif percent_change < -30:
-                        insights.append({
-                            "type": "hiring_decline",
-                            "company": company,
-                            "percent_change": percent_change,
-                            "insight": f"Hiring decline detected: {company} has decreased hiring by {abs(percent_change):.1f}% compared to the previous period."
-                        })
-        
-        # Analyze role patterns
-        if "roles_by_company" in processed_data:
-            for company, roles in processed_data["roles_by_company"].items():
-                # Leadership roles often indicate strategic changes
-                leadership_roles = ["CEO", "CFO", "CTO", "COO", "CHRO", "CMO", "President", "Director", "VP", "Head"]
-                
-                leadership_count = sum(count for role, count in roles.items() 
-                                     if any(leader in role for leader in leadership_roles))
-                
-                if leadership_count >= 2:
-                    insights.append({
-                        "type": "leadership_changes",
-                        "company": company,
-                        "count": leadership_count,
-                        "insight": f"Leadership changes: {company} is hiring for {leadership_count} leadership positions, indicating potential organizational changes."
-                    })
-                
-                # Detect specific technology focus
-                tech_categories = {
-                    "AI/ML": ["AI", "Machine Learning", "Data Scientist", "NLP", "Computer Vision", "Deep Learning"],
-                    "Cloud": ["AWS", "Azure", "GCP", "Cloud", "DevOps", "SRE", "Kubernetes"],
-                    "Mobile": ["iOS", "Android", "Mobile", "React Native", "Flutter"],
-                    "Frontend": ["Frontend", "UI", "UX", "React", "Angular", "Vue"],
-                    "Backend": ["Backend", "API", "Microservices", "Node.js", "Java", "Python", "Go", "Ruby"]
+            result = func(*args, **kwargs)
+            with lock:
+                cache[key] = copy.deepcopy(result)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorator
+
+_TECH_MATCHER = _build_keyword_matcher(TECH_CATEGORIES)
+_ROLE_CATEGORY_MATCHER = _build_keyword_matcher(ROLE_CATEGORIES)
+_ROLE_CATEGORY_NAMES = list(ROLE_CATEGORIES)
+
+# Flag set on role bitmasks for leadership titles, above the tech category bits
+_LEADERSHIP_BIT = 1 << len(TECH_CATEGORIES)
+_GEOGRAPHIC_REGION_PATTERNS = _compile_keyword_patterns(GEOGRAPHIC_REGIONS)
+_SHIFT_REGION_PATTERNS = _compile_keyword_patterns(SHIFT_REGIONS)
+
+# Fixed fields of each recommendation type
+_INDUSTRY_SKILL_INVESTMENT_TEMPLATE = {"type": "industry_skill_investment", "priority": "high"}
+_INDUSTRY_LOCATION_STRATEGY_TEMPLATE = {"type": "industry_location_strategy", "priority": "medium"}
+_INDUSTRY_COMPETITOR_ANALYSIS_TEMPLATE = {"type": "industry_competitor_analysis", "priority": "high"}
+_INDUSTRY_SPECIALIZATION_TEMPLATE = {"type": "industry_specialization", "priority": "medium"}
+_SKILL_INVESTMENT_TEMPLATE = {"type": "skill_investment", "priority": "high"}
+_GEOGRAPHIC_EXPANSION_TEMPLATE = {"type": "geographic_expansion", "priority": "medium"}
+_COMPETITIVE_MONITORING_TEMPLATE = {"type": "competitive_monitoring", "priority": "high"}
+_TECHNOLOGY_INVESTMENT_TEMPLATE = {"type": "technology_investment", "priority": "high"}
+_COMPETITIVE_ADVANTAGE_TEMPLATE = {"type": "competitive_advantage", "priority": "medium"}
+_STRATEGIC_SHIFT_TEMPLATE = {"type": "strategic_shift", "priority": "medium"}
+_STRATEGIC_POSITIONING_TEMPLATE = {"type": "strategic_positioning", "priority": "low"}
+
+# Recommendations for a value shared by multiple insights of one type:
+# insight type -> (insight field, recommendation template, recommendation field, text)
+_TOP_COUNT_RULES = {
+    "geographic_shift": ("region", _GEOGRAPHIC_EXPANSION_TEMPLATE, "region", 
+                         "Consider {0} market presence. Multiple competitors are expanding hiring in this region, indicating potential market opportunities."),
+    "technology_focus": ("category", _TECHNOLOGY_INVESTMENT_TEMPLATE, "technology", 
+                         "Strategically evaluate {0} investments. Multiple competitors are heavily investing in this technology area, signaling industry direction.")
+}
+
+def iter_hiring_trends(processed_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Analyze hiring trends from processed job data, yielding insights one at a time.
+    
+    Args:
+        processed_data: Processed job data
+    
+    Yields:
+        Hiring trend insight dictionaries
+    """
+    # Analyze hiring velocity
+    if "hiring_velocity" in processed_data:
+        companies = processed_data["companies"]
+        velocity = _velocity_matrix(processed_data["hiring_velocity"], companies)
+        percent_changes, has_history = _period_percent_changes(velocity)
+        
+        for index in np.flatnonzero(has_history & (np.abs(percent_changes) > 30)):
+            company = companies[index]
+            percent_change = float(percent_changes[index])
+            
+            if percent_change > 30:
+                yield {
+                    "type": "hiring_surge",
+                    "company": company,
+                    "percent_change": percent_change,
+                    "insight": f"Hiring surge detected: {company} has increased hiring by {percent_change:.1f}% compared to the previous period."
                 }
-                
-                for category, keywords in tech_categories.items():
-                    category_count = sum(count for role, count in roles.items() 
-                                       if any(keyword.lower() in role.lower() for keyword in keywords))
-                    
-                    if category_count >= 3:
-                        insights.append({
-                            "type": "technology_focus",
-                            "company": company,
-                            "category": category,
-                            "count": category_count,
-                            "insight": f"Technology focus: {company} is hiring {category_count} roles in {category}, indicating strategic investment in this area."
-                        })
-        
-        # Analyze location patterns
-        if "locations_by_company" in processed_data:
-            for company, locations in processed_data["locations_by_company"].items():
-                remote_count = sum(count for location, count in locations.items() 
-                                 if "remote" in location.lower())
-                
-                total_jobs = sum(locations.values())
-                if total_jobs > 0:
-                    remote_percentage = (remote_count / total_jobs) * 100
-                    
-                    if remote_percentage > 50:
-                        insights.append({
-                            "type": "remote_work",
-                            "company": company,
-                            "percentage": remote_percentage,
-                            "insight": f"Remote work focus: {company} has {remote_percentage:.1f}% remote positions, indicating a strong remote work culture."
-                        })
-                
-                # Geographic expansion
-                regions = {
-                    "North America": ["US", "USA", "United States", "Canada", "Mexico"],
-                    "Europe": ["UK", "United Kingdom", "Germany", "France", "Spain", "Italy", "Netherlands", "Sweden"],
-                    "Asia": ["China", "Japan", "India", "Singapore", "Hong Kong"],
-                    "Latin America": ["Brazil", "Argentina", "Colombia", "Chile", "Peru"],
-                    "Africa": ["South Africa", "Nigeria", "Kenya", "Egypt"],
-                    "Australia/Oceania": ["Australia", "New Zealand"]
+            else:
+                yield {
+                    "type": "hiring_decline",
+                    "company": company,
+                    "percent_change": percent_change,
+                    "insight": f"Hiring decline detected: {company} has decreased hiring by {abs(percent_change):.1f}% compared to the previous period."
                 }
-                
-                region_counts = {region: 0 for region in regions}
-                for location, count in locations.items():
-                    for region, keywords in regions.items():
-                        if any(keyword.lower() in location.lower() for keyword in keywords):
-                            region_counts[region] += count
-                
-                # Identify regions with significant presence
-                for region, count in region_counts.items():
-                    if count >= 3:
-                        insights.append({
-                            "type": "geographic_expansion",
-                            "company": company,
-                            "region": region,
-                            "count": count,
-                            "insight": f"Geographic focus: {company} has {count} positions in {region}, indicating strategic focus or expansion in this region."
-                        })
+    
+    # Analyze role patterns
+    if "roles_by_company" in processed_data:
+        # Classify each distinct role title once and share the result across companies
+        distinct_roles = {role for roles in processed_data["roles_by_company"].values() for role in roles}
+        role_masks = {role: _match_mask(role, _TECH_MATCHER) 
+                           | (_LEADERSHIP_BIT if any(leader in role for leader in LEADERSHIP_TITLES) else 0)
+                      for role in distinct_roles}
         
+        for company, roles in processed_data["roles_by_company"].items():
+            # Total the roles per distinct classification, then expand with bitwise tests
+            mask_counts = defaultdict(int)
+            for role, count in roles.items():
+                mask_counts[role_masks[role]] += count
+            
+            leadership_count = sum(count for mask, count in mask_counts.items() if mask & _LEADERSHIP_BIT)
+            category_counts = {category: sum(count for mask, count in mask_counts.items() if mask & (1 << bit))
+                               for bit, category in enumerate(TECH_CATEGORIES)}
+            
+            # Leadership roles often indicate strategic changes
+            if leadership_count >= 2:
+                yield {
+                    "type": "leadership_changes",
+                    "company": company,
+                    "count": leadership_count,
+                    "insight": f"Leadership changes: {company} is hiring for {leadership_count} leadership positions, indicating potential organizational changes."
+                }
+            
+            # Detect specific technology focus
+            for category, category_count in category_counts.items():
+                if category_count >= 3:
+                    yield {
+                        "type": "technology_focus",
+                        "company": company,
+                        "category": category,
+                        "count": category_count,
+                        "insight": f"Technology focus: {company} is hiring {category_count} roles in {category}, indicating strategic investment in this area."
+                    }
+    
+    # Analyze location patterns
+    if "locations_by_company" in processed_data:
+        locations_df = _flatten_company_counts(processed_data["locations_by_company"], "location")
+        location_names = locations_df["location"].str.lower()
+        
+        is_remote = location_names.str.contains("remote", regex=False)
+        total_jobs_by_company = locations_df.groupby("company", sort=False, observed=True)["count"].sum()
+        remote_by_company = locations_df[is_remote].groupby("company", sort=False, observed=True)["count"].sum()
+        
+        # Total the counts per company for each region with one vectorized regex scan
+        region_totals = {region: locations_df[location_names.str.contains(pattern)]
+                                 .groupby("company", sort=False, observed=True)["count"].sum()
+                         for region, pattern in _GEOGRAPHIC_REGION_PATTERNS.items()}
+        
+        for company in processed_data["locations_by_company"]:
+            remote_count = remote_by_company.get(company, 0)
+            total_jobs = total_jobs_by_company.get(company, 0)
+            
+            if total_jobs > 0:
+                remote_percentage = float((remote_count / total_jobs) * 100)
+                
+                if remote_percentage > 50:
+                    yield {
+                        "type": "remote_work",
+                        "company": company,
+                        "percentage": remote_percentage,
+                        "insight": f"Remote work focus: {company} has {remote_percentage:.1f}% remote positions, indicating a strong remote work culture."
+                    }
+            
+            # Identify regions with significant presence
+            for region in GEOGRAPHIC_REGIONS:
+                count = int(region_totals[region].get(company, 0))
+                if count >= 3:
+                    yield {
+                        "type": "geographic_expansion",
+                        "company": company,
+                        "region": region,
+                        "count": count,
+                        "insight": f"Geographic focus: {company} has {count} positions in {region}, indicating strategic focus or expansion in this region."
+                    }
+
+@_memoize_analysis()
+def analyze_hiring_trends(processed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Analyze hiring trends from processed job data.
+    
+    Args:
+        processed_data: Processed job data
+    
+    Returns:
+        List of hiring trend insights
+    """
+    logger.info("Analyzing hiring trends")
+    
+    try:
+        insights = list(iter_hiring_trends(processed_data))
         logger.info(f"Generated {len(insights)} hiring trend insights")
         return insights
     
@@ -151,6 +426,77 @@ def analyze_hiring_trends(processed_data: Dict[str, Any]) -> List[Dict[str, Any]
         logger.error(f"Error analyzing hiring trends: {str(e)}")
         return []
 
+def iter_skill_patterns(processed_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Identify patterns in skill requirements across companies, yielding insights one at a time.
+    
+    Args:
+        processed_data: Processed job data
+    
+    Yields:
+        Skill pattern insight dictionaries
+    """
+    if "skills_by_company" in processed_data:
+        skills_df = _flatten_company_counts(processed_data["skills_by_company"], "skill")
+        
+        # Calculate skill prevalence across companies and total demand per skill.
+        # Each (company, skill) pair appears once, so group sizes are company counts.
+        skill_groups = skills_df.groupby("skill", sort=False, observed=True)
+        companies_per_skill = skill_groups.size()
+        skill_prevalence = companies_per_skill / len(processed_data["companies"])
+        skill_demand = skill_groups["count"].sum()
+        
+        # Identify emerging skills (in 10-40% of companies, at least 5 jobs require this skill)
+        emerging_mask = skill_prevalence.between(0.1, 0.4) & (skill_demand >= 5)
+        emerging_skills = skill_demand[emerging_mask]
+        
+        # Take top 5 by total demand
+        for skill, demand in emerging_skills.nlargest(5).items():
+            prevalence = float(skill_prevalence[skill])
+            demand = int(demand)
+            yield {
+                "type": "emerging_skill",
+                "skill": skill,
+                "prevalence": prevalence,
+                "demand": demand,
+                "insight": f"Emerging skill: {skill} is appearing in {prevalence*100:.1f}% of companies with {demand} total job postings."
+            }
+        
+        # Identify highly competitive skills (in 70%+ of companies, at least 10 jobs require this skill)
+        competitive_mask = (skill_prevalence >= 0.7) & (skill_demand >= 10)
+        competitive_skills = skill_demand[competitive_mask]
+        
+        # Take top 5 by total demand
+        for skill, demand in competitive_skills.nlargest(5).items():
+            prevalence = float(skill_prevalence[skill])
+            demand = int(demand)
+            yield {
+                "type": "competitive_skill",
+                "skill": skill,
+                "prevalence": prevalence,
+                "demand": demand,
+                "insight": f"Competitive skill: {skill} is in high demand across {prevalence*100:.1f}% of companies with {demand} total job postings."
+            }
+        
+        # Identify company-specific skills (unique to one company and in multiple jobs)
+        unique_mask = skill_groups["company"].transform("size").eq(1) & skills_df["count"].ge(2)
+        unique_by_company = {company: group 
+                             for company, group in skills_df[unique_mask].groupby("company", sort=False, observed=True)}
+        
+        for company in processed_data["companies"]:
+            if company in unique_by_company:
+                # Take top 3 by count
+                for skill, count in unique_by_company[company].nlargest(3, "count")[["skill", "count"]].itertuples(index=False):
+                    count = int(count)
+                    yield {
+                        "type": "unique_skill",
+                        "company": company,
+                        "skill": skill,
+                        "count": count,
+                        "insight": f"Unique focus: {company} is the only company hiring for {skill} ({count} positions), indicating a potential competitive advantage."
+                    }
+
+@_memoize_analysis()
 def identify_skill_patterns(processed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Identify patterns in skill requirements across companies.
@@ -164,83 +510,7 @@ def identify_skill_patterns(processed_data: Dict[str, Any]) -> List[Dict[str, An
     logger.info("Identifying skill patterns")
     
     try:
-        insights = []
-        
-        if "skills_by_company" in processed_data:
-            # Get all unique skills
-            all_skills = set()
-            for company_skills in processed_data["skills_by_company"].values():
-                all_skills.update(company_skills.keys())
-            
-            # Calculate skill prevalence across companies
-            skill_prevalence = {}
-            for skill in all_skills:
-                companies_with_skill = sum(1 for company, skills in processed_data["skills_by_company"].items() 
-                                         if skill in skills)
-                skill_prevalence[skill] = companies_with_skill / len(processed_data["companies"])
-            
-            # Identify emerging skills (low prevalence but appearing in multiple companies)
-            emerging_skills = []
-            for skill, prevalence in skill_prevalence.items():
-                if 0.1 <= prevalence <= 0.4:  # In 10-40% of companies
-                    total_demand = sum(skills.get(skill, 0) for skills in processed_data["skills_by_company"].values())
-                    if total_demand >= 5:  # At least 5 jobs require this skill
-                        emerging_skills.append((skill, prevalence, total_demand))
-            
-            # Sort by total demand and take top 5
-            emerging_skills.sort(key=lambda x: x[2], reverse=True)
-            for skill, prevalence, demand in emerging_skills[:5]:
-                insights.append({
-                    "type": "emerging_skill",
-                    "skill": skill,
-                    "prevalence": prevalence,
-                    "demand": demand,
-                    "insight": f"Emerging skill: {skill} is appearing in {prevalence*100:.1f}% of companies with {demand} total job postings."
-                })
-            
-            # Identify highly competitive skills (high prevalence across companies)
-            competitive_skills = []
-            for skill, prevalence in skill_prevalence.items():
-                if prevalence >= 0.7:  # In 70%+ of companies
-                    total_demand = sum(skills.get(skill, 0) for skills in processed_data["skills_by_company"].values())
-                    if total_demand >= 10:  # At least 10 jobs require this skill
-                        competitive_skills.append((skill, prevalence, total_demand))
-            
-            # Sort by total demand and take top 5
-            competitive_skills.sort(key=lambda x: x[2], reverse=True)
-            for skill, prevalence, demand in competitive_skills[:5]:
-                insights.append({
-                    "type": "competitive_skill",
-                    "skill": skill,
-                    "prevalence": prevalence,
-                    "demand": demand,
-                    "insight": f"Competitive skill: {skill} is in high demand across {prevalence*100:.1f}% of companies with {demand} total job postings."
-                })
-            
-            # Identify company-specific skills (unique to one or few companies)
-            for company in processed_data["companies"]:
-                if company in processed_data["skills_by_company"]:
-                    company_skills = processed_data["skills_by_company"][company]
-                    
-                    unique_skills = []
-                    for skill, count in company_skills.items():
-                        other_companies_with_skill = sum(1 for c, skills in processed_data["skills_by_company"].items() 
-                                                      if c != company and skill in skills)
-                        
-                        if other_companies_with_skill == 0 and count >= 2:  # Unique to this company and in multiple jobs
-                            unique_skills.append((skill, count))
-                    
-                    # Sort by count and take top 3
-                    unique_skills.sort(key=lambda x: x[1], reverse=True)
-                    for skill, count in unique_skills[:3]:
-                        insights.append({
-                            "type": "unique_skill",
-                            "company": company,
-                            "skill": skill,
-                            "count": count,
-                            "insight": f"Unique focus: {company} is the only company hiring for {skill} ({count} positions), indicating a potential competitive advantage."
-                        })
-        
+        insights = list(iter_skill_patterns(processed_data))
         logger.info(f"Generated {len(insights)} skill pattern insights")
         return insights
     
@@ -248,6 +518,111 @@ def identify_skill_patterns(processed_data: Dict[str, Any]) -> List[Dict[str, An
         logger.error(f"Error identifying skill patterns: {str(e)}")
         return []
 
+def iter_market_shifts(processed_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Detect potential market shifts based on hiring patterns, yielding insights one at a time.
+    
+    Args:
+        processed_data: Processed job data
+    
+    Yields:
+        Market shift insight dictionaries
+    """
+    # Analyze role distribution changes
+    if "role_distribution" in processed_data:
+        companies = processed_data["companies"]
+        role_df = pd.DataFrame(processed_data["role_distribution"], columns=["role", *companies])
+        
+        # Determine which category each role belongs to (first match wins, -1 if none)
+        category_index = np.fromiter(((mask & -mask).bit_length() - 1 
+                                      for mask in (_match_mask(role, _ROLE_CATEGORY_MATCHER) for role in role_df["role"])), 
+                                     dtype=np.intp, count=len(role_df))
+        assigned = category_index >= 0
+        
+        # Group role counts into a (companies x categories) matrix
+        category_matrix = np.zeros((len(companies), len(_ROLE_CATEGORY_NAMES)))
+        np.add.at(category_matrix.T, category_index[assigned], 
+                  role_df[companies].fillna(0).to_numpy(dtype=np.float64)[assigned])
+        
+        # Calculate percentage of each category for each company with categorized roles
+        totals = category_matrix.sum(axis=1, keepdims=True)
+        percentages = np.divide(category_matrix, totals, out=np.zeros_like(category_matrix), where=totals > 0) * 100
+        active_rows = np.flatnonzero(totals[:, 0] > 0)
+        
+        # Identify significant category focuses (company has a strong focus in this category)
+        for row, column in zip(*np.nonzero(percentages[active_rows] >= 40)):
+            company = companies[active_rows[row]]
+            category = _ROLE_CATEGORY_NAMES[column]
+            percentage = float(percentages[active_rows[row], column])
+            yield {
+                "type": "category_focus",
+                "company": company,
+                "category": category,
+                "percentage": percentage,
+                "insight": f"Strategic focus: {company} is heavily investing in {category} ({percentage:.1f}% of hiring), indicating a strategic priority."
+            }
+        
+        # Compare companies to identify divergent strategies
+        if len(active_rows) >= 2:
+            active_percentages = percentages[active_rows]
+            # Highest share is the first maximum, lowest share the last minimum
+            top_rows = active_rows[active_percentages.argmax(axis=0)]
+            bottom_rows = active_rows[len(active_rows) - 1 - active_percentages[::-1].argmin(axis=0)]
+            
+            for column, category in enumerate(_ROLE_CATEGORY_NAMES):
+                top_company = companies[top_rows[column]]
+                top_percentage = float(percentages[top_rows[column], column])
+                bottom_company = companies[bottom_rows[column]]
+                bottom_percentage = float(percentages[bottom_rows[column], column])
+                
+                difference = top_percentage - bottom_percentage
+                if difference >= 30 and top_percentage >= 25:  # Significant difference
+                    yield {
+                        "type": "divergent_strategy",
+                        "category": category,
+                        "top_company": top_company,
+                        "top_percentage": top_percentage,
+                        "bottom_company": bottom_company,
+                        "bottom_percentage": bottom_percentage,
+                        "difference": difference,
+                        "insight": f"Divergent strategies: {top_company} is investing heavily in {category} ({top_percentage:.1f}%), while {bottom_company} is not ({bottom_percentage:.1f}%), suggesting different market approaches."
+                    }
+    
+    # Analyze geographic shifts
+    if "location_distribution" in processed_data:
+        companies = processed_data["companies"]
+        location_df = pd.DataFrame(processed_data["location_distribution"], columns=["location", *companies])
+        location_names = location_df["location"].str.lower()
+        location_counts = location_df[companies].fillna(0)
+        
+        # Group locations by region (first matching region wins) into a (companies x regions) matrix
+        region_names = list(SHIFT_REGIONS)
+        region_matrix = np.zeros((len(companies), len(region_names)))
+        unassigned = pd.Series(True, index=location_df.index)
+        for column, (region, pattern) in enumerate(_SHIFT_REGION_PATTERNS.items()):
+            in_region = unassigned & location_names.str.contains(pattern)
+            unassigned &= ~in_region
+            region_matrix[:, column] = location_counts[in_region].to_numpy(dtype=np.float64).sum(axis=0)
+        
+        # Share of each company's roles located in each region
+        totals = region_matrix.sum(axis=1, keepdims=True)
+        percentages = np.divide(region_matrix, totals, out=np.zeros_like(region_matrix), where=totals > 0) * 100
+        
+        # Identify emerging regions (significant non-US focus)
+        is_international = np.arange(len(region_names)) != region_names.index("North America")
+        for row, column in zip(*np.nonzero((percentages >= 20) & is_international)):
+            company = companies[row]
+            region = region_names[column]
+            percentage = float(percentages[row, column])
+            yield {
+                "type": "geographic_shift",
+                "company": company,
+                "region": region,
+                "percentage": percentage,
+                "insight": f"Geographic shift: {company} has {percentage:.1f}% of roles in {region}, indicating international expansion or market focus."
+            }
+
+@_memoize_analysis()
 def detect_market_shifts(processed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Detect potential market shifts based on hiring patterns.
@@ -261,129 +636,7 @@ def detect_market_shifts(processed_data: Dict[str, Any]) -> List[Dict[str, Any]]
     logger.info("Detecting market shifts")
     
     try:
-        insights = []
-        
-        # Analyze role distribution changes
-        if "role_distribution" in processed_data:
-            # Group roles into categories
-            role_categories = {
-                "Engineering": ["Engineer", "Developer", "Programmer", "Architect"],
-                "Data": ["Data", "Analytics", "Scientist", "Analyst"],
-                "Product": ["Product", "Manager", "Owner"],
-                "Design": ["Design", "UX", "UI", "User Experience"],
-                "Marketing": ["Marketing", "Growth", "SEO", "Content"],
-                "Sales": ["Sales", "Account", "Business Development"],
-                "Operations": ["Operations", "Support", "Customer Success"]
-            }
-            
-            category_counts = {company: {category: 0 for category in role_categories} 
-                              for company in processed_data["companies"]}
-            
-            for role_data in processed_data["role_distribution"]:
-                role = role_data["role"]
-                
-                # Determine which category this role belongs to
-                assigned_category = None
-                for category, keywords in role_categories.items():
-                    if any(keyword.lower() in role.lower() for keyword in keywords):
-                        assigned_category = category
-                        break
-                
-                if assigned_category:
-                    for company in processed_data["companies"]:
-                        if company in role_data:
-                            category_counts[company][assigned_category] += role_data[company]
-            
-            # Calculate percentage of each category for each company
-            category_percentages = {}
-            for company, categories in category_counts.items():
-                total = sum(categories.values())
-                if total > 0:
-                    category_percentages[company] = {category: (count / total) * 100 
-                                                   for category, count in categories.items()}
-            
-            # Identify significant category focuses
-            for company, percentages in category_percentages.items():
-                for category, percentage in percentages.items():
-                    if percentage >= 40:  # Company has a strong focus in this category
-                        insights.append({
-                            "type": "category_focus",
-                            "company": company,
-                            "category": category,
-                            "percentage": percentage,
-                            "insight": f"Strategic focus: {company} is heavily investing in {category} ({percentage:.1f}% of hiring), indicating a strategic priority."
-                        })
-            
-            # Compare companies to identify divergent strategies
-            if len(category_percentages) >= 2:
-                for category in role_categories:
-                    company_percentages = [(company, percentages.get(category, 0)) 
-                                          for company, percentages in category_percentages.items()]
-                    
-                    company_percentages.sort(key=lambda x: x[1], reverse=True)
-                    
-                    if len(company_percentages) >= 2:
-                        top_company, top_percentage = company_percentages[0]
-                        bottom_company, bottom_percentage = company_percentages[-1]
-                        
-                        difference = top_percentage - bottom_percentage
-                        if difference >= 30 and top_percentage >= 25:  # Significant difference
-                            insights.append({
-                                "type": "divergent_strategy",
-                                "category": category,
-                                "top_company": top_company,
-                                "top_percentage": top_percentage,
-                                "bottom_company": bottom_company,
-                                "bottom_percentage": bottom_percentage,
-                                "difference": difference,
-                                "insight": f"Divergent strategies: {top_company} is investing heavily in {category} ({top_percentage:.1f}%), while {bottom_company} is not ({bottom_percentage:.1f}%), suggesting different market approaches."
-                            })
-        
-        # Analyze geographic shifts
-        if "location_distribution" in processed_data:
-            # Group locations by region
-            regions = {
-                "North America": ["US", "USA", "United States", "Canada", "Mexico"],
-                "Europe": ["UK", "United Kingdom", "Germany", "France", "Spain", "Italy", "Netherlands", "Sweden"],
-                "Asia": ["China", "Japan", "India", "Singapore", "Hong Kong"],
-                "Latin America": ["Brazil", "Argentina", "Colombia", "Chile", "Peru"],
-                "Remote": ["Remote", "Virtual", "Work from home", "WFH"]
-            }
-            
-            region_counts = {company: {region: 0 for region in regions} 
-                            for company in processed_data["companies"]}
-            
-            for location_data in processed_data["location_distribution"]:
-                location = location_data["location"]
-                
-                # Determine which region this location belongs to
-                assigned_region = None
-                for region, keywords in regions.items():
-                    if any(keyword.lower() in location.lower() for keyword in keywords):
-                        assigned_region = region
-                        break
-                
-                if assigned_region:
-                    for company in processed_data["companies"]:
-                        if company in location_data:
-                            region_counts[company][assigned_region] += location_data[company]
-            
-            # Identify emerging regions
-            for company, region_data in region_counts.items():
-                total_locations = sum(region_data.values())
-                if total_locations > 0:
-                    for region, count in region_data.items():
-                        percentage = (count / total_locations) * 100
-                        
-                        if region != "North America" and percentage >= 20:  # Significant non-US focus
-                            insights.append({
-                                "type": "geographic_shift",
-                                "company": company,
-                                "region": region,
-                                "percentage": percentage,
-                                "insight": f"Geographic shift: {company} has {percentage:.1f}% of roles in {region}, indicating international expansion or market focus."
-                            })
-        
+        insights = list(iter_market_shifts(processed_data))
         logger.info(f"Generated {len(insights)} market shift insights")
         return insights
     
@@ -391,174 +644,183 @@ def detect_market_shifts(processed_data: Dict[str, Any]) -> List[Dict[str, Any]]
         logger.error(f"Error detecting market shifts: {str(e)}")
         return []
 
-def analyze_industry_trends(processed_data: Dict[str, Any], companies_data: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+def iter_industry_trends(processed_data: Dict[str, Any], companies_data: List[Dict[str, Any]]) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
     """
-    Analyze trends and patterns specific to each industry.
+    Analyze trends and patterns specific to each industry, one industry at a time.
     
     Args:
         processed_data: Processed job data
         companies_data: List of company data with industry information
     
-    Returns:
-        Dictionary mapping industries to lists of industry-specific insights
+    Yields:
+        Tuples of (industry, list of industry-specific insights)
     """
-    logger.info("Analyzing industry-specific trends")
+    # Group companies by industry
+    companies_by_industry = {}
+    for company in companies_data:
+        industry = company.get("industry")
+        if industry:
+            if industry not in companies_by_industry:
+                companies_by_industry[industry] = []
+            companies_by_industry[industry].append(company.get("name"))
     
-    try:
-        # Group companies by industry
-        companies_by_industry = {}
-        for company in companies_data:
-            industry = company.get("industry")
-            if industry:
-                if industry not in companies_by_industry:
-                    companies_by_industry[industry] = []
-                companies_by_industry[industry].append(company.get("name"))
-        
-        industry_insights = {}
-        
-        # For each industry, analyze specific trends
-        for industry, industry_companies in companies_by_industry.items():
-            industry_insights[industry] = []
-            
-            # Skip if there are too few companies in this industry
-            if len(industry_companies) < 2:
-                continue
+    # Skill names per company as frozensets for fast membership tests
+    skill_keys = {company: frozenset(skills) 
+                  for company, skills in processed_data.get("skills_by_company", {}).items()}
+    
+    # Average jobs per period for each company
+    average_velocity = {}
+    if processed_data.get("hiring_velocity"):
+        velocity = _velocity_matrix(processed_data["hiring_velocity"], processed_data["companies"])
+        average_velocity = dict(zip(processed_data["companies"], velocity.mean(axis=0).tolist()))
+    
+    # Boolean (companies x skills) matrix of which companies hire for which skills
+    company_rows = {company: row for row, company in enumerate(skill_keys)}
+    skill_columns = {skill: column 
+                     for column, skill in enumerate(dict.fromkeys(itertools.chain.from_iterable(skill_keys.values())))}
+    has_skill = np.zeros((len(company_rows), len(skill_columns)), dtype=bool)
+    for row, skills in enumerate(skill_keys.values()):
+        has_skill[row, [skill_columns[skill] for skill in skills]] = True
+    
+    # For each industry, analyze specific trends
+    for industry, industry_companies in companies_by_industry.items():
+        insights = []
+        
+        # Skip if there are too few companies in this industry
+        if len(industry_companies) < 2:
+            yield industry, insights
+            continue
+        
+        # 1. Analyze hiring velocity within this industry
+        if "hiring_velocity" in processed_data:
+            industry_velocity = {company: average_velocity[company] 
+                                 for company in industry_companies if company in average_velocity}
             
-            # 1. Analyze hiring velocity within this industry
-            if "hiring_velocity" in processed_data:
-                velocity_data = processed_data["hiring_velocity"]
-                industry_velocity = {}
+            if industry_velocity:
+                # Calculate industry average
+                if len(industry_velocity) > 0:
+                    industry_avg = sum(industry_velocity.values()) / len(industry_velocity)
+                else:
+                    industry_avg = 0  # Default value if no companies have velocity data
                 
-                for company in industry_companies:
-                    # Calculate average jobs per period
-                    if company in processed_data["companies"] and len(velocity_data) > 0:
-                        company_velocity = sum(data.get(company, 0) for data in velocity_data) / len(velocity_data)
-                        industry_velocity[company] = company_velocity
+                # Find companies significantly above average (25% or more)
+                above_avg_companies = [(company, vel) for company, vel in industry_velocity.items() 
+                                      if vel >= industry_avg * 1.25]
                 
-                if industry_velocity:
-                    # Calculate industry average
-                    if len(industry_velocity) > 0:
-                        industry_avg = sum(industry_velocity.values()) / len(industry_velocity)
-                    else:
-                        industry_avg = 0  # Default value if no companies have velocity data
-                    
-                    # Find companies significantly above average (25% or more)
-                    above_avg_companies = [(company, vel) for company, vel in industry_velocity.items() 
-                                          if vel >= industry_avg * 1.25]
+                if above_avg_companies:
+                    # Highest velocity wins
+                    top_company, velocity = max(above_avg_companies, key=lambda x: x[1])
                     
-                    if above_avg_companies:
-                        # Sort by velocity descending
-                        above_avg_companies.sort(key=lambda x: x[1], reverse=True)
-                        top_company, velocity = above_avg_companies[0]
+                    # Ensure safe division for percentage calculation
+                    if industry_avg > 0:
+                        percentage_above = ((velocity/industry_avg)-1)*100
+                    else:
+                        percentage_above = 100  # Default to 100% if industry_avg is zero
                         
-                        # Ensure safe division for percentage calculation
-                        if industry_avg > 0:
-                            percentage_above = ((velocity/industry_avg)-1)*100
-                        else:
-                            percentage_above = 100  # Default to 100% if industry_avg is zero
-                            
-                        industry_insights[industry].append({
-                            "type": "industry_leader",
-                            "company": top_company,
-                            "industry": industry,
-                            "velocity": velocity,
-                            "industry_avg": industry_avg,
-                            "insight": f"Industry leader: {top_company} is hiring at {velocity:.1f} jobs per period, {percentage_above:.1f}% above the {industry} industry average."
-                        })
-            
-            # 2. Analyze skill demand specific to this industry
-            if "skills_by_company" in processed_data:
-                # Collect all skills for companies in this industry
-                industry_skills = {}
-                for company in industry_companies:
-                    if company in processed_data["skills_by_company"]:
-                        company_skills = processed_data["skills_by_company"][company]
-                        for skill, count in company_skills.items():
-                            if skill not in industry_skills:
-                                industry_skills[skill] = 0
-                            industry_skills[skill] += count
-                
-                # Find top skills for this industry
-                if industry_skills:
-                    top_skills = sorted(industry_skills.items(), key=lambda x: x[1], reverse=True)[:5]
-                    skill_list = ", ".join([skill for skill, _ in top_skills])
-                    
-                    industry_insights[industry].append({
-                        "type": "industry_skills",
+                    insights.append({
+                        "type": "industry_leader",
+                        "company": top_company,
                         "industry": industry,
-                        "top_skills": [skill for skill, _ in top_skills],
-                        "insight": f"Critical {industry} skills: The most in-demand skills in the {industry} industry are {skill_list}."
+                        "velocity": velocity,
+                        "industry_avg": industry_avg,
+                        "insight": f"Industry leader: {top_company} is hiring at {velocity:.1f} jobs per period, {percentage_above:.1f}% above the {industry} industry average."
                     })
-                    
-                    # Identify industry-specific skills (more common in this industry than others)
-                    other_industries = set(companies_by_industry.keys()) - {industry}
-                    other_industry_companies = []
-                    for ind in other_industries:
-                        other_industry_companies.extend(companies_by_industry[ind])
-                    
-                    industry_specific = []
-                    for skill, industry_count in industry_skills.items():
-                        # Calculate what percentage of this industry's companies need this skill
-                        # Ensure we don't divide by zero if industry_companies is empty
-                        if len(industry_companies) > 0:
-                            industry_prevalence = sum(1 for company in industry_companies 
-                                                   if company in processed_data["skills_by_company"] and 
-                                                   skill in processed_data["skills_by_company"][company]) / len(industry_companies)
-                        else:
-                            industry_prevalence = 0
-                        
-                        # Calculate what percentage of other industries' companies need this skill
-                        # Ensure we don't divide by zero for empty other_industry_companies
-                        if len(other_industry_companies) > 0:
-                            other_prevalence = sum(1 for company in other_industry_companies 
-                                                if company in processed_data["skills_by_company"] and 
-                                                skill in processed_data["skills_by_company"][company]) / len(other_industry_companies)
-                        else:
-                            other_prevalence = 0
-                        
-                        # Use a safe division approach to prevent division by zero
-                        prevalence_ratio = industry_prevalence / max(0.01, other_prevalence) if other_prevalence > 0 else float('inf')
-                        
-                        # If much more prevalent in this industry
-                        if industry_prevalence >= 0.4 and prevalence_ratio >= 2:
-                            industry_specific.append((skill, industry_prevalence, prevalence_ratio))
-                    
-                    if industry_specific:
-                        # Sort by industry-specificity ratio
-                        industry_specific.sort(key=lambda x: x[2], reverse=True)
-                        specific_skill = industry_specific[0][0]
-                        
-                        industry_insights[industry].append({
-                            "type": "industry_specific_skill",
-                            "industry": industry,
-                            "skill": specific_skill,
-                            "insight": f"Industry specialization: {specific_skill} is a specialized skill particularly important in the {industry} industry."
-                        })
+        
+        # 2. Analyze skill demand specific to this industry
+        if "skills_by_company" in processed_data:
+            # Collect all skills for companies in this industry
+            industry_skills = Counter()
+            for company in industry_companies:
+                industry_skills.update(processed_data["skills_by_company"].get(company, {}))
             
-            # 3. Analyze geographic trends for this industry
-            if "locations_by_company" in processed_data:
-                # Collect locations across industry
-                industry_locations = {}
-                for company in industry_companies:
-                    if company in processed_data["locations_by_company"]:
-                        company_locations = processed_data["locations_by_company"][company]
-                        for location, count in company_locations.items():
-                            if location not in industry_locations:
-                                industry_locations[location] = 0
-                            industry_locations[location] += count
+            # Find top skills for this industry
+            if industry_skills:
+                top_skills = industry_skills.most_common(5)
+                skill_list = ", ".join([skill for skill, _ in top_skills])
+                
+                insights.append({
+                    "type": "industry_skills",
+                    "industry": industry,
+                    "top_skills": [skill for skill, _ in top_skills],
+                    "insight": f"Critical {industry} skills: The most in-demand skills in the {industry} industry are {skill_list}."
+                })
+                
+                # Identify industry-specific skills (more common in this industry than others)
+                other_industries = set(companies_by_industry.keys()) - {industry}
+                other_industry_companies = set(itertools.chain.from_iterable(
+                    companies_by_industry[ind] for ind in other_industries))
+                
+                # Restrict the skill matrix to this industry's skills
+                industry_skill_names = list(industry_skills)
+                industry_has_skill = has_skill[:, [skill_columns[skill] for skill in industry_skill_names]]
+                industry_rows = [company_rows[company] for company in set(industry_companies) if company in company_rows]
+                other_rows = [company_rows[company] for company in other_industry_companies if company in company_rows]
+                
+                # Calculate what percentage of this industry's companies need each skill
+                industry_prevalence = np.count_nonzero(industry_has_skill[industry_rows], axis=0) / len(industry_companies)
+                
+                # Calculate what percentage of other industries' companies need each skill
+                # Ensure we don't divide by zero for empty other_industry_companies
+                if other_industry_companies:
+                    other_prevalence = np.count_nonzero(industry_has_skill[other_rows], axis=0) / len(other_industry_companies)
+                else:
+                    other_prevalence = np.zeros(len(industry_skill_names))
+                
+                # Use a safe division approach to prevent division by zero
+                prevalence_ratio = np.divide(industry_prevalence, np.maximum(0.01, other_prevalence), 
+                                             out=np.full(len(industry_skill_names), np.inf), where=other_prevalence > 0)
+                
+                # Skills much more prevalent in this industry
+                industry_specific = np.flatnonzero((industry_prevalence >= 0.4) & (prevalence_ratio >= 2))
                 
-                if industry_locations:
-                    # Find top locations for this industry
-                    top_locations = sorted(industry_locations.items(), key=lambda x: x[1], reverse=True)[:3]
-                    location_list = ", ".join([location for location, _ in top_locations])
+                if industry_specific.size:
+                    # Pick the highest industry-specificity ratio
+                    specific_skill = industry_skill_names[industry_specific[prevalence_ratio[industry_specific].argmax()]]
                     
-                    industry_insights[industry].append({
-                        "type": "industry_hubs",
+                    insights.append({
+                        "type": "industry_specific_skill",
                         "industry": industry,
-                        "top_locations": [location for location, _ in top_locations],
-                        "insight": f"Industry hubs: The main hiring locations in the {industry} industry are {location_list}."
+                        "skill": specific_skill,
+                        "insight": f"Industry specialization: {specific_skill} is a specialized skill particularly important in the {industry} industry."
                     })
         
+        # 3. Analyze geographic trends for this industry
+        if "locations_by_company" in processed_data:
+            # Collect locations across industry
+            industry_locations = Counter()
+            for company in industry_companies:
+                industry_locations.update(processed_data["locations_by_company"].get(company, {}))
+            
+            if industry_locations:
+                # Find top locations for this industry
+                top_locations = industry_locations.most_common(3)
+                location_list = ", ".join([location for location, _ in top_locations])
+                
+                insights.append({
+                    "type": "industry_hubs",
+                    "industry": industry,
+                    "top_locations": [location for location, _ in top_locations],
+                    "insight": f"Industry hubs: The main hiring locations in the {industry} industry are {location_list}."
+                })
+        
+        yield industry, insights
+
+@_memoize_analysis()
+def analyze_industry_trends(processed_data: Dict[str, Any], companies_data: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Analyze trends and patterns specific to each industry.
+    
+    Args:
+        processed_data: Processed job data
+        companies_data: List of company data with industry information
+    
+    Returns:
+        Dictionary mapping industries to lists of industry-specific insights
+    """
+    logger.info("Analyzing industry-specific trends")
+    
+    try:
+        industry_insights = dict(iter_industry_trends(processed_data, companies_data))
         logger.info(f"Generated industry-specific insights for {len(industry_insights)} industries")
         return industry_insights
     
@@ -566,205 +828,226 @@ def analyze_industry_trends(processed_data: Dict[str, Any], companies_data: List
         logger.error(f"Error analyzing industry trends: {str(e)}")
         return {}
 
-def generate_industry_recommendations(industry_insights: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+def group_insights_by_type(insights: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Generate industry-specific strategic recommendations.
+    Group insights into lists keyed by insight type, preserving order.
     
     Args:
-        industry_insights: Dictionary of industry-specific insights
+        insights: List of insight dictionaries
     
     Returns:
-        Dictionary mapping industries to lists of recommendations
+        Dictionary mapping insight types to lists of insights
     """
-    logger.info("Generating industry-specific recommendations")
-    
-    try:
-        industry_recommendations = {}
-        
-        for industry, insights in industry_insights.items():
-            industry_recommendations[industry] = []
-            
-            # Group insights by type
-            insight_types = {}
-            for insight in insights:
-                insight_type = insight["type"]
-                if insight_type not in insight_types:
-                    insight_types[insight_type] = []
-                insight_types[insight_type].append(insight)
-            
-            # 1. Skills investment recommendation
-            if "industry_skills" in insight_types:
-                skills_insight = insight_types["industry_skills"][0]
-                top_skills = skills_insight.get("top_skills", [])
-                if top_skills:
-                    skill_list = ", ".join(top_skills[:3])
-                    industry_recommendations[industry].append({
-                        "type": "industry_skill_investment",
-                        "industry": industry,
-                        "skills": top_skills[:3],
-                        "priority": "high",
-                        "recommendation": f"Focus training on {industry}-critical skills: {skill_list}. These skills are in highest demand across the industry."
-                    })
-            
-            # 2. Location strategy recommendation
-            if "industry_hubs" in insight_types:
-                hubs_insight = insight_types["industry_hubs"][0]
-                top_locations = hubs_insight.get("top_locations", [])
-                if top_locations:
-                    location = top_locations[0]
-                    industry_recommendations[industry].append({
-                        "type": "industry_location_strategy",
-                        "industry": industry,
-                        "location": location,
-                        "priority": "medium",
-                        "recommendation": f"Consider talent presence in {location}, the primary hiring hub for the {industry} industry."
-                    })
-            
-            # 3. Competitive intelligence recommendation
-            if "industry_leader" in insight_types:
-                leader_insight = insight_types["industry_leader"][0]
-                company = leader_insight.get("company")
-                if company:
-                    industry_recommendations[industry].append({
-                        "type": "industry_competitor_analysis",
-                        "industry": industry,
-                        "company": company,
-                        "priority": "high",
-                        "recommendation": f"Monitor {company}'s strategic moves closely. They are the hiring leader in the {industry} industry, which may indicate upcoming market initiatives."
-                    })
-            
-            # 4. Specialization recommendation
-            if "industry_specific_skill" in insight_types:
-                specific_insight = insight_types["industry_specific_skill"][0]
-                skill = specific_insight.get("skill")
-                if skill:
-                    industry_recommendations[industry].append({
-                        "type": "industry_specialization",
-                        "industry": industry,
-                        "skill": skill,
-                        "priority": "medium",
-                        "recommendation": f"Develop expertise in {skill}, a specialized skill particularly valuable in the {industry} industry."
-                    })
-        
-        logger.info(f"Generated recommendations for {len(industry_recommendations)} industries")
-        return industry_recommendations
-    
-    except Exception as e:
-        logger.error(f"Error generating industry recommendations: {str(e)}")
-        return {}
+    get_type = itemgetter("type")
+    insight_types = defaultdict(list)
+    for insight in insights:
+        insight_types[get_type(insight)].append(insight)
+    return insight_types
 
-def generate_strategic_recommendations(insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def generate_industry_recommendations(industry_insights: Union[Dict[str, List[Dict[str, Any]]], pd.DataFrame]) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Generate strategic recommendations based on analyzed insights.
+    Generate industry-specific strategic recommendations.
     
     Args:
-        insights: List of insights from various analysis functions
+        industry_insights: Dictionary of industry-specific insights (as lists or already
+            grouped with group_insights_by_type), or a DataFrame with one insight per row
+            and "industry" and "type" columns
     
     Returns:
-        List of strategic recommendations
+        Dictionary mapping industries to lists of recommendations
     """
-    logger.info("Generating strategic recommendations")
+    # len() rather than truthiness so DataFrames are handled too
+    if len(industry_insights) == 0:
+        return {}
     
-    try:
-        recommendations = []
-        
-        # Group insights by type
-        insight_types = {}
-        for insight in insights:
-            insight_type = insight["type"]
-            if insight_type not in insight_types:
-                insight_types[insight_type] = []
-            insight_types[insight_type].append(insight)
-        
-        # Generate recommendations based on emerging skills
-        if "emerging_skill" in insight_types:
-            emerging_skills = [insight["skill"] for insight in insight_types["emerging_skill"]]
-            if emerging_skills:
-                skill_list = ", ".join(emerging_skills[:3])
-                recommendations.append({
-                    "type": "skill_investment",
-                    "skills": emerging_skills[:3],
-                    "priority": "high",
-                    "recommendation": f"Invest in training for emerging skills: {skill_list}. These skills are growing in demand but not yet widespread, providing a competitive advantage window."
-                })
+    logger.info("Generating industry-specific recommendations")
+    
+    industry_recommendations = {}
+    
+    # Only the first insight of each type is used, so reduce frames with one groupby
+    if isinstance(industry_insights, pd.DataFrame):
+        industry_insights = _first_insights_by_industry(industry_insights)
+    
+    for industry, insights in industry_insights.items():
+        recommendations = industry_recommendations[industry] = []
+        industry_phrase = f"the {industry} industry"
         
-        # Generate recommendations based on geographic shifts
-        if "geographic_shift" in insight_types:
-            region_counts = Counter([insight["region"] for insight in insight_types["geographic_shift"]])
-            if region_counts:
-                top_region, count = region_counts.most_common(1)[0]
-                if count >= 2:  # Multiple companies focusing on this region
-                    recommendations.append({
-                        "type": "geographic_expansion",
-                        "region": top_region,
-                        "priority": "medium",
-                        "recommendation": f"Consider {top_region} market presence. Multiple competitors are expanding hiring in this region, indicating potential market opportunities."
-                    })
+        # Group insights by type unless the caller already did
+        insight_types = insights if isinstance(insights, dict) else group_insights_by_type(insights)
         
-        # Generate recommendations based on hiring surges
-        if "hiring_surge" in insight_types:
-            surging_companies = [insight["company"] for insight in insight_types["hiring_surge"]]
-            if surging_companies:
-                companies_list = ", ".join(surging_companies[:3])
+        # 1. Skills investment recommendation
+        industry_skills_insights = insight_types.get("industry_skills")
+        if industry_skills_insights:
+            skills_insight = industry_skills_insights[0]
+            top_skills = skills_insight.get("top_skills", [])
+            if top_skills:
+                top_skills = top_skills[:3]
+                skill_list = ", ".join(top_skills)
                 recommendations.append({
-                    "type": "competitive_monitoring",
-                    "companies": surging_companies[:3],
-                    "priority": "high",
-                    "recommendation": f"Monitor product launches from {companies_list}. These companies show significant hiring surges, often preceding major product initiatives."
+                    **_INDUSTRY_SKILL_INVESTMENT_TEMPLATE,
+                    "industry": industry,
+                    "skills": top_skills,
+                    "recommendation": f"Focus training on {industry}-critical skills: {skill_list}. These skills are in highest demand across the industry."
                 })
         
-        # Generate recommendations based on technology focus
-        if "technology_focus" in insight_types:
-            tech_counts = Counter([insight["category"] for insight in insight_types["technology_focus"]])
-            if tech_counts:
-                top_tech, count = tech_counts.most_common(1)[0]
-                if count >= 2:  # Multiple companies focusing on this technology
-                    recommendations.append({
-                        "type": "technology_investment",
-                        "technology": top_tech,
-                        "priority": "high",
-                        "recommendation": f"Strategically evaluate {top_tech} investments. Multiple competitors are heavily investing in this technology area, signaling industry direction."
-                    })
-        
-        # Generate recommendations based on unique skills
-        if "unique_skill" in insight_types:
-            unique_skills = [(insight["company"], insight["skill"]) for insight in insight_types["unique_skill"]]
-            if unique_skills:
-                company, skill = unique_skills[0]
+        # 2. Location strategy recommendation
+        industry_hubs_insights = insight_types.get("industry_hubs")
+        if industry_hubs_insights:
+            hubs_insight = industry_hubs_insights[0]
+            top_locations = hubs_insight.get("top_locations", [])
+            if top_locations:
+                location = top_locations[0]
                 recommendations.append({
-                    "type": "competitive_advantage",
-                    "company": company,
-                    "skill": skill,
-                    "priority": "medium",
-                    "recommendation": f"Research {company}'s use of {skill}. They're uniquely hiring for this skill, potentially indicating proprietary technology or market differentiation."
+                    **_INDUSTRY_LOCATION_STRATEGY_TEMPLATE,
+                    "industry": industry,
+                    "location": location,
+                    "recommendation": f"Consider talent presence in {location}, the primary hiring hub for {industry_phrase}."
                 })
         
-        # Generate recommendations based on leadership changes
-        if "leadership_changes" in insight_types:
-            companies_with_leadership_changes = [insight["company"] for insight in insight_types["leadership_changes"]]
-            if companies_with_leadership_changes:
-                companies_list = ", ".join(companies_with_leadership_changes[:2])
+        # 3. Competitive intelligence recommendation
+        industry_leader_insights = insight_types.get("industry_leader")
+        if industry_leader_insights:
+            leader_insight = industry_leader_insights[0]
+            company = leader_insight.get("company")
+            if company:
                 recommendations.append({
-                    "type": "strategic_shift",
-                    "companies": companies_with_leadership_changes[:2],
-                    "priority": "medium",
-                    "recommendation": f"Prepare for potential strategic shifts from {companies_list}. Leadership hiring often precedes major strategic changes or funding events."
+                    **_INDUSTRY_COMPETITOR_ANALYSIS_TEMPLATE,
+                    "industry": industry,
+                    "company": company,
+                    "recommendation": f"Monitor {company}'s strategic moves closely. They are the hiring leader in {industry_phrase}, which may indicate upcoming market initiatives."
                 })
         
-        # Generate recommendations based on divergent strategies
-        if "divergent_strategy" in insight_types:
-            for insight in insight_types["divergent_strategy"][:2]:  # Limit to top 2 insights
+        # 4. Specialization recommendation
+        industry_specific_skill_insights = insight_types.get("industry_specific_skill")
+        if industry_specific_skill_insights:
+            specific_insight = industry_specific_skill_insights[0]
+            skill = specific_insight.get("skill")
+            if skill:
                 recommendations.append({
-                    "type": "strategic_positioning",
-                    "category": insight["category"],
-                    "companies": [insight["top_company"], insight["bottom_company"]],
-                    "priority": "low",
-                    "recommendation": f"Evaluate your positioning in {insight['category']} relative to competitors. {insight['top_company']} is heavily investing while {insight['bottom_company']} is not, indicating different market bets."
+                    **_INDUSTRY_SPECIALIZATION_TEMPLATE,
+                    "industry": industry,
+                    "skill": skill,
+                    "recommendation": f"Develop expertise in {skill}, a specialized skill particularly valuable in {industry_phrase}."
                 })
-        
-        logger.info(f"Generated {len(recommendations)} strategic recommendations")
-        return recommendations
     
-    except Exception as e:
-        logger.error(f"Error generating strategic recommendations: {str(e)}")
+    logger.info(f"Generated recommendations for {len(industry_recommendations)} industries")
+    return industry_recommendations
+
+def _top_count_recommendation(insight_types: Dict[str, List[Dict[str, Any]]], insight_type: str) -> Optional[Dict[str, Any]]:
+    """
+    Recommend the most common value among insights of a type, per _TOP_COUNT_RULES.
+    
+    Args:
+        insight_types: Dictionary mapping insight types to lists of insights
+        insight_type: Insight type with a rule in _TOP_COUNT_RULES
+    
+    Returns:
+        Recommendation dictionary, or None if no value is shared by multiple insights
+    """
+    insights = insight_types.get(insight_type)
+    if not insights:
+        return None
+    
+    field, template, recommendation_field, text = _TOP_COUNT_RULES[insight_type]
+    top_value, count = _most_common_value([insight[field] for insight in insights])
+    if count < 2:  # Multiple companies must share this value
+        return None
+    
+    return {**template, recommendation_field: top_value, "recommendation": text.format(top_value)}
+
+def generate_strategic_recommendations(insights: Union[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    """
+    Generate strategic recommendations based on analyzed insights.
+    
+    Args:
+        insights: List of insights from various analysis functions, or the same
+            insights already grouped with group_insights_by_type
+    
+    Returns:
+        List of strategic recommendations
+    """
+    if not insights:
         return []
+    
+    logger.info("Generating strategic recommendations")
+    
+    recommendations = []
+    
+    # Group insights by type unless the caller already did
+    insight_types = insights if isinstance(insights, dict) else group_insights_by_type(insights)
+    
+    # Generate recommendations based on emerging skills
+    emerging_skill_insights = insight_types.get("emerging_skill")
+    if emerging_skill_insights:
+        emerging_skills = [insight["skill"] for insight in emerging_skill_insights]
+        if emerging_skills:
+            emerging_skills = emerging_skills[:3]
+            skill_list = ", ".join(emerging_skills)
+            recommendations.append({
+                **_SKILL_INVESTMENT_TEMPLATE,
+                "skills": emerging_skills,
+                "recommendation": f"Invest in training for emerging skills: {skill_list}. These skills are growing in demand but not yet widespread, providing a competitive advantage window."
+            })
+    
+    # Generate recommendations based on geographic shifts
+    geographic_recommendation = _top_count_recommendation(insight_types, "geographic_shift")
+    if geographic_recommendation:
+        recommendations.append(geographic_recommendation)
+    
+    # Generate recommendations based on hiring surges
+    hiring_surge_insights = insight_types.get("hiring_surge")
+    if hiring_surge_insights:
+        surging_companies = [insight["company"] for insight in hiring_surge_insights]
+        if surging_companies:
+            surging_companies = surging_companies[:3]
+            companies_list = ", ".join(surging_companies)
+            recommendations.append({
+                **_COMPETITIVE_MONITORING_TEMPLATE,
+                "companies": surging_companies,
+                "recommendation": f"Monitor product launches from {companies_list}. These companies show significant hiring surges, often preceding major product initiatives."
+            })
+    
+    # Generate recommendations based on technology focus
+    technology_recommendation = _top_count_recommendation(insight_types, "technology_focus")
+    if technology_recommendation:
+        recommendations.append(technology_recommendation)
+    
+    # Generate recommendations based on unique skills
+    unique_skill_insights = insight_types.get("unique_skill")
+    if unique_skill_insights:
+        unique_skills = [(insight["company"], insight["skill"]) for insight in unique_skill_insights]
+        if unique_skills:
+            company, skill = unique_skills[0]
+            recommendations.append({
+                **_COMPETITIVE_ADVANTAGE_TEMPLATE,
+                "company": company,
+                "skill": skill,
+                "recommendation": f"Research {company}'s use of {skill}. They're uniquely hiring for this skill, potentially indicating proprietary technology or market differentiation."
+            })
+    
+    # Generate recommendations based on leadership changes
+    leadership_changes_insights = insight_types.get("leadership_changes")
+    if leadership_changes_insights:
+        companies_with_leadership_changes = [insight["company"] for insight in leadership_changes_insights]
+        if companies_with_leadership_changes:
+            companies_with_leadership_changes = companies_with_leadership_changes[:2]
+            companies_list = ", ".join(companies_with_leadership_changes)
+            recommendations.append({
+                **_STRATEGIC_SHIFT_TEMPLATE,
+                "companies": companies_with_leadership_changes,
+                "recommendation": f"Prepare for potential strategic shifts from {companies_list}. Leadership hiring often precedes major strategic changes or funding events."
+            })
+    
+    # Generate recommendations based on divergent strategies
+    divergent_strategy_insights = insight_types.get("divergent_strategy")
+    if divergent_strategy_insights:
+        for insight in divergent_strategy_insights[:2]:  # Limit to top 2 insights
+            recommendations.append({
+                **_STRATEGIC_POSITIONING_TEMPLATE,
+                "category": insight["category"],
+                "companies": [insight["top_company"], insight["bottom_company"]],
+                "recommendation": f"Evaluate your positioning in {insight['category']} relative to competitors. {insight['top_company']} is heavily investing while {insight['bottom_company']} is not, indicating different market bets."
+            })
+    
+    logger.info(f"Generated {len(recommendations)} strategic recommendations")
+    return recommendations
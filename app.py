@@ -1,11 +1,17 @@
 import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
 import pandas as pd
-import json
+import numpy as np
+import copy
+import re
 import datetime
 import time
 import io
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from scraper import (
     scrape_job_listings, 
     load_companies_data, 
@@ -24,10 +30,11 @@ from analyzer import (
 )
 from visualizer import create_hiring_trend_chart, create_skill_heatmap, create_geo_expansion_map
 from notifier import setup_email_preferences
-from database import get_db_connection, save_company_to_watch, get_watched_companies
+from database import (
+    get_db_connection, save_company_to_watch, save_companies_to_watch, get_watched_companies,
+    save_achievements, load_achievements
+)
 from utils import get_demo_data
-from resume_analyzer import extract_resume_content, analyze_resume_vs_company_jobs, generate_resume_insights, get_career_opportunity_score
-from talent_analyzer import analyze_talent_availability, get_top_cities_for_talent, get_skill_prevalence, get_competing_companies
 
 # Configure logging
 logging.basicConfig(
@@ -44,6 +51,495 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Predefined top tech companies for bulk-adding to the watchlist
+TOP_TECH_COMPANIES = (
+    "Apple", "Microsoft", "Google", "Amazon", "Meta", 
+    "Tesla", "NVIDIA", "Samsung", "Intel", "IBM",
+    "Oracle", "Salesforce", "Adobe", "SAP", "OpenAI",
+    "Palantir", "Snowflake", "Databricks", "Cisco", "ServiceNow",
+    "Sony", "LG Electronics", "Dell Technologies", "HP", "Lenovo",
+    "ASUS", "Xiaomi", "OnePlus", "Huawei", "Razer",
+    "Stripe", "PayPal", "Square", "Robinhood", "Coinbase", 
+    "CrowdStrike", "Darktrace", "Cloudflare", "Okta", "Zscaler",
+    "SpaceX", "Rivian", "Waymo", "ByteDance", "Epic Games",
+    "DeepMind", "Anduril", "QuantumScape", "Boston Dynamics", "Cruise"
+)
+
+# Sidebar navigation views, keyed by the current_view they select
+VIEWS = {
+    "dashboard": "📊 Dashboard",
+    "company": "🔎 Company Intelligence",
+    "resume": "📄 Resume Analyzer",
+    "talent": "🔍 Talent Demand",
+    "gamification": "🎮 Gamification",
+    "settings": "⚙️ Settings"
+}
+
+# Job fields shown in the real-time job table, mapped to their column headers
+JOB_TABLE_COLUMNS = {
+    "title": "Job Title",
+    "location": "Location",
+    "status": "Status",
+    "posted_time": "Posted",
+    "timestamp": "Timestamp"
+}
+
+# Default achievements and their unlock levels for new users
+DEFAULT_ACHIEVEMENTS = {
+    'companies_tracked': {
+        'name': 'Company Tracker',
+        'description': 'Track multiple competitor companies',
+        'levels': [
+            {'name': 'Beginner', 'threshold': 1, 'badge': '🥉', 'unlocked': False},
+            {'name': 'Intermediate', 'threshold': 5, 'badge': '🥈', 'unlocked': False},
+            {'name': 'Advanced', 'threshold': 10, 'badge': '🥇', 'unlocked': False},
+            {'name': 'Expert', 'threshold': 25, 'badge': '👑', 'unlocked': False}
+        ],
+        'current_level': 0,
+        'progress': 0,
+        'max': 25
+    },
+    'industries_analyzed': {
+        'name': 'Industry Analyst',
+        'description': 'Analyze different industries for hiring trends',
+        'levels': [
+            {'name': 'Beginner', 'threshold': 1, 'badge': '🥉', 'unlocked': False},
+            {'name': 'Intermediate', 'threshold': 3, 'badge': '🥈', 'unlocked': False},
+            {'name': 'Advanced', 'threshold': 5, 'badge': '🥇', 'unlocked': False},
+            {'name': 'Expert', 'threshold': 7, 'badge': '👑', 'unlocked': False}
+        ],
+        'current_level': 0,
+        'progress': 0,
+        'max': 7
+    },
+    'talent_searches': {
+        'name': 'Talent Scout',
+        'description': 'Search for talent in various locations',
+        'levels': [
+            {'name': 'Beginner', 'threshold': 1, 'badge': '🥉', 'unlocked': False},
+            {'name': 'Intermediate', 'threshold': 5, 'badge': '🥈', 'unlocked': False},
+            {'name': 'Advanced', 'threshold': 15, 'badge': '🥇', 'unlocked': False},
+            {'name': 'Expert', 'threshold': 30, 'badge': '👑', 'unlocked': False}
+        ],
+        'current_level': 0,
+        'progress': 0,
+        'max': 30,
+        'locations_searched': []
+    },
+    'resumes_analyzed': {
+        'name': 'Resume Expert',
+        'description': 'Analyze resumes against job requirements',
+        'levels': [
+            {'name': 'Beginner', 'threshold': 1, 'badge': '🥉', 'unlocked': False},
+            {'name': 'Intermediate', 'threshold': 5, 'badge': '🥈', 'unlocked': False},
+            {'name': 'Advanced', 'threshold': 10, 'badge': '🥇', 'unlocked': False},
+            {'name': 'Expert', 'threshold': 20, 'badge': '👑', 'unlocked': False}
+        ],
+        'current_level': 0,
+        'progress': 0,
+        'max': 20
+    },
+    'insights_generated': {
+        'name': 'Insight Generator',
+        'description': 'Generate hiring insights from data',
+        'levels': [
+            {'name': 'Beginner', 'threshold': 5, 'badge': '🥉', 'unlocked': False},
+            {'name': 'Intermediate', 'threshold': 15, 'badge': '🥈', 'unlocked': False},
+            {'name': 'Advanced', 'threshold': 30, 'badge': '🥇', 'unlocked': False},
+            {'name': 'Expert', 'threshold': 50, 'badge': '👑', 'unlocked': False}
+        ],
+        'current_level': 0,
+        'progress': 0, 
+        'max': 50
+    }
+}
+
+# Largest resume file accepted by the resume analyzer upload
+MAX_RESUME_UPLOAD_BYTES = 5 * 1024 * 1024
+
+# Cell styles for highlighted job statuses in the real-time job table
+_STATUS_STYLE = {
+    "NEW": 'background-color: #d4f7dc; font-weight: bold',
+    "UPDATED": 'background-color: #f7f3d4; font-weight: bold',
+}
+
+# Heading colors for resume job matches by match quality
+_QUALITY_COLOR = {
+    "Excellent": "green",
+    "Good": "blue",
+    "Fair": "orange"
+}
+
+# Skill development priorities as (roles needing the skill above, label), highest first
+_SKILL_PRIORITIES = (
+    (2, "High"),
+    (1, "Medium")
+)
+
+# Text styles for each skill development priority in the priority skills table
+_SKILL_PRIORITY_STYLE = {
+    "High": 'color: #ff4b4b; font-weight: bold',
+    "Medium": 'color: #ff9d45; font-weight: bold',
+    "Normal": 'color: #2986cc; font-weight: bold'
+}
+
+# Static HTML blocks for the resume view's career development plan
+PRIORITY_SKILLS_HEADER_HTML = """
+<div style="background-color:#f8f9fa; padding:15px; border-radius:10px; margin-bottom:15px;">
+    <h3 style="color:#0066cc;">🎯 Priority Skills to Develop</h3>
+    <p>Based on your resume analysis across all companies, these skills would most significantly improve your marketability:</p>
+</div>
+"""
+
+DEVELOPMENT_TIMELINE_HEADER_HTML = """
+<div style="background-color:#f8f9fa; padding:15px; border-radius:10px; margin:20px 0;">
+    <h3 style="color:#0066cc;">📅 Development Timeline</h3>
+    <p>A suggested timeline for skill acquisition based on priority:</p>
+</div>
+"""
+
+# Skills suggested for an online course or a certification in the priority skills table
+_COURSE_SKILL_RE = re.compile(r"python|javascript", re.IGNORECASE)
+_CERTIFICATION_SKILL_RE = re.compile(r"aws|cloud", re.IGNORECASE)
+
+# Development timeline columns as (skill priority, border color, period)
+TIMELINE_STAGES = (
+    ("High", "#ff4b4b", "Short-term (1-3 months)"),
+    ("Medium", "#ff9d45", "Mid-term (3-6 months)"),
+    ("Normal", "#2986cc", "Long-term (6+ months)")
+)
+
+TIMELINE_COLUMN_HTML = """
+<div style="border-left:3px solid {border_color}; padding-left:10px; margin-bottom:15px;">
+    <h4>{period}</h4>
+    <ul style="padding-left:15px;">{skill_items}</ul>
+</div>
+"""
+
+CAREER_RECOMMENDATIONS_HEADER_HTML = """
+<div style="background-color:#f8f9fa; padding:15px; border-radius:10px; margin:20px 0;">
+    <h3 style="color:#0066cc;">📋 General Career Development Recommendations</h3>
+</div>
+"""
+
+RESUME_ENHANCEMENT_HTML = """
+<div style="background-color:#ffffff; padding:15px; border-radius:10px; height:100%;">
+    <h4>Resume Enhancement</h4>
+    <ul>
+        <li>Tailor your resume for specific job applications</li>
+        <li>Quantify achievements with metrics where possible</li>
+        <li>Highlight projects that demonstrate your skills</li>
+        <li>Use action verbs and industry keywords</li>
+    </ul>
+</div>
+"""
+
+PROFESSIONAL_DEVELOPMENT_HTML = """
+<div style="background-color:#ffffff; padding:15px; border-radius:10px; height:100%;">
+    <h4>Professional Development</h4>
+    <ul>
+        <li>Focus on developing the most in-demand skills</li>
+        <li>Build a portfolio showcasing your abilities</li>
+        <li>Network with professionals in target companies</li>
+        <li>Contribute to open-source or community projects</li>
+    </ul>
+</div>
+"""
+
+# Status badges for job postings in the company view
+_STATUS_COLOR = {
+    'NEW': '🟢',
+    'UPDATED': '🟡',
+    'ACTIVE': '🔵',
+    'CLOSING SOON': '🟠'
+}
+
+# Most companies shown in the industry view's raw data table
+RAW_COMPANY_ROW_LIMIT = 200
+
+# Pie slice colors for the talent work location preferences
+_WORK_TYPE_COLORS = {
+    "Remote": "#1f77b4",
+    "Hybrid": "#ff7f0e",
+    "On-site": "#2ca02c"
+}
+
+# Simulated job mix given to every company when industry analysis runs without real-time data
+_DEMO_COMPANY_ROLES = {"Software Engineer": 5, "Data Scientist": 3}
+_DEMO_COMPANY_SKILLS = {"Python": 4, "JavaScript": 3, "Cloud": 2}
+_DEMO_COMPANY_LOCATIONS = {"San Francisco": 3, "New York": 2, "Remote": 5}
+
+# Cached data loaders
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _demo_data():
+    """Demo data shared across reruns and sessions; read-only, so it is not copied per call"""
+    return get_demo_data()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _watched_companies():
+    """Watched companies from the database, cleared whenever the watchlist is saved"""
+    return get_watched_companies()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _pdf_text(pdf_bytes):
+    """Text of an uploaded PDF resume, parsed once per distinct file"""
+    from resume_analyzer import extract_pdf_text
+    return extract_pdf_text(pdf_bytes)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _resume_content(resume_text):
+    """Structured content of a resume, extracted once per distinct text"""
+    from resume_analyzer import extract_resume_content
+    return extract_resume_content(resume_text)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _resume_job_matches(resume_data, company_jobs):
+    """Resume matches against one company's jobs, reused across reruns"""
+    from resume_analyzer import analyze_resume_vs_company_jobs
+    return analyze_resume_vs_company_jobs(resume_data, company_jobs)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _linkedin_profile_text(linkedin_url):
+    """Resume text for a LinkedIn profile, fetched at most once an hour per URL"""
+    # Profile extraction is simulated; the profile name comes from the URL slug
+    profile_name = linkedin_url.rstrip("/").split("/")[-1].replace("-", " ").title()
+    if not profile_name:
+        profile_name = "Demo Profile"
+    
+    return f"""
+        {profile_name}
+        
+        SKILLS
+        Python, Data Analysis, Machine Learning, JavaScript, React, SQL, AWS, Leadership
+        
+        EXPERIENCE
+        Senior Data Analyst at TechCorp (2019 - Present)
+        - Led data analysis initiatives for enterprise clients
+        - Developed predictive models using machine learning
+        
+        Data Scientist at Innovation Labs (2017 - 2019)
+        - Built data pipelines for processing large datasets
+        - Collaborated with cross-functional teams on AI projects
+        
+        EDUCATION
+        M.S. in Computer Science, Stanford University (2015-2017)
+        B.S. in Statistics, UC Berkeley (2011-2015)
+        
+        PROJECTS
+        Smart City Data Analysis
+        Customer Segmentation Algorithm
+    """
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _talent_availability(job_role, location, skills_key):
+    """Talent market analysis for a role, location and sorted skills tuple"""
+    from talent_analyzer import analyze_talent_availability
+    return analyze_talent_availability(job_role, location, list(skills_key))
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _companies_data():
+    """Company dataset shared across reruns and sessions; read-only, so it is not copied per call"""
+    return load_companies_data()
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _companies_df():
+    """Company dataset as a shared read-only DataFrame for vectorized filtering"""
+    companies_df = pd.DataFrame(_companies_data())
+    # Filter columns must exist even if no company sets them; as categoricals they
+    # are stored as small integer codes and compared without string hashing
+    for column in ("name", "industry", "priority"):
+        if column not in companies_df:
+            companies_df[column] = None
+        companies_df[column] = companies_df[column].astype("category")
+    return companies_df
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _companies_by_industry():
+    """Company DataFrame split by industry once per process, for dictionary lookups instead of rescans"""
+    return dict(tuple(_companies_df().groupby("industry", observed=True, sort=False)))
+
+def _industry_options():
+    """Sorted distinct industry names in the company data"""
+    return sorted(industry for industry in _companies_by_industry() if industry)
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _industry_hiring_trends():
+    """Industry-level hiring trends, regenerated at most once an hour; read-only, so it is not copied per call"""
+    return get_industry_hiring_trends()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _demo_processed_data(company_names, hiring_velocity):
+    """Simulated processed job data for the given companies; every company shares the same inner dicts"""
+    return {
+        "companies": list(company_names),
+        "hiring_velocity": hiring_velocity,
+        "roles_by_company": dict.fromkeys(company_names, _DEMO_COMPANY_ROLES),
+        "skills_by_company": dict.fromkeys(company_names, _DEMO_COMPANY_SKILLS),
+        "locations_by_company": dict.fromkeys(company_names, _DEMO_COMPANY_LOCATIONS)
+    }
+
+# Cached chart builders, keyed on the chart data so identical figures are built once
+@st.cache_data(max_entries=16, show_spinner=False)
+def _hiring_trend_fig(hiring_velocity_data):
+    """Hiring velocity chart for the given data"""
+    return create_hiring_trend_chart(hiring_velocity_data)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _skill_heatmap_fig(skills_data):
+    """Skill demand heatmap for the given data"""
+    return create_skill_heatmap(skills_data)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _geo_map_fig(location_data):
+    """Geographic hiring map for the given data"""
+    return create_geo_expansion_map(location_data)
+
+def _bar_fig(categories, values, title, category_title, value_title, color=None, color_title=None, orientation='h', color_range=None):
+    """Bar chart built straight from column arrays, colored on a Viridis scale"""
+    x_title, y_title = (value_title, category_title) if orientation == 'h' else (category_title, value_title)
+    # Same tooltip as plotly.express: x, then y, then the color value when it is a separate column
+    hovertemplate = f"{x_title}=%{{x}}<br>{y_title}=%{{y}}"
+    if color is None:
+        color, color_title = values, value_title
+    else:
+        hovertemplate += f"<br>{color_title}=%{{marker.color}}"
+    bar = go.Bar(
+        x=values if orientation == 'h' else categories,
+        y=categories if orientation == 'h' else values,
+        orientation=orientation,
+        marker={'color': color, 'coloraxis': 'coloraxis'},
+        hovertemplate=hovertemplate + "<extra></extra>"
+    )
+    coloraxis = {'colorscale': 'Viridis', 'colorbar': {'title': {'text': color_title}}}
+    if color_range is not None:
+        coloraxis['cmin'], coloraxis['cmax'] = color_range
+    category_axis, value_axis = ('yaxis', 'xaxis') if orientation == 'h' else ('xaxis', 'yaxis')
+    return go.Figure(bar, layout={
+        'title': {'text': title},
+        'barmode': 'relative',
+        'coloraxis': coloraxis,
+        category_axis: {'title': {'text': category_title}},
+        value_axis: {'title': {'text': value_title}}
+    })
+
+def _pie_fig(labels, values, title, label_title, value_title, hole=0, colors=None):
+    """Pie or donut chart built straight from column arrays"""
+    return go.Figure(
+        go.Pie(
+            labels=labels,
+            values=values,
+            hole=hole,
+            marker={'colors': colors},
+            hovertemplate=f"{label_title}=%{{label}}<br>{value_title}=%{{value}}<extra></extra>"
+        ),
+        layout={'title': {'text': title}}
+    )
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _skill_prevalence_fig(skill_data, job_role):
+    """Skill prevalence bar chart for a job role"""
+    fig = _bar_fig(
+        skill_data["skill"].to_numpy(),
+        skill_data["prevalence"].to_numpy(),
+        f"Skill Prevalence for {job_role} (% of candidates)",
+        "Skill",
+        "% of Candidates",
+        color_range=(0, 100)
+    )
+    fig.update_layout(yaxis={'categoryorder':'total ascending'})
+    return fig
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _competing_companies_fig(competing_companies, job_role):
+    """Monthly job postings bar chart for companies competing for a role"""
+    return _bar_fig(
+        competing_companies["name"].to_numpy(),
+        competing_companies["role_count"].to_numpy(),
+        f"Companies Hiring {job_role} Talent",
+        "Company",
+        "Monthly Job Postings",
+        orientation='v'
+    )
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _level_distribution_fig(level_data, title):
+    """Donut chart of the percentage per level, for education and experience breakdowns"""
+    return _pie_fig(level_data["level"].to_numpy(), level_data["percentage"].to_numpy(), title, "level", "percentage", hole=0.4)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _remote_work_fig(remote_df, job_role):
+    """Remote, hybrid and on-site preference pie chart for a job role"""
+    return _pie_fig(
+        remote_df["Work Type"].to_numpy(),
+        remote_df["Percentage"].to_numpy(),
+        f"Work Location Preferences for {job_role} Talent",
+        "Work Type",
+        "Percentage",
+        colors=remote_df["Work Type"].map(_WORK_TYPE_COLORS).to_numpy()
+    )
+
+# Industry view chart builders, uncached here because industry_figures keeps their results in session state
+def _industry_roles_fig(roles_df, industry):
+    """Most in-demand roles bar chart for an industry"""
+    return _bar_fig(
+        roles_df["role"].to_numpy(),
+        roles_df["count"].to_numpy(),
+        f"Most In-Demand Roles in {industry}",
+        "Role",
+        "Open Positions",
+        color=roles_df["growth"].to_numpy(),
+        color_title="YoY Growth (%)"
+    )
+
+def _industry_skills_fig(skills_df, industry):
+    """Most in-demand skills bar chart for an industry"""
+    return _bar_fig(
+        skills_df["skill"].to_numpy(),
+        skills_df["demand_score"].to_numpy(),
+        f"Most In-Demand Skills in {industry}",
+        "Skill",
+        "Demand Score",
+        color=skills_df["growth"].to_numpy(),
+        color_title="YoY Growth (%)"
+    )
+
+@st.cache_resource(show_spinner=False)
+def _industry_comparison_template():
+    """Layout shared by the industry comparison bar charts, built once per process"""
+    return go.Figure(layout={
+        'barmode': 'relative',
+        'coloraxis': {'colorscale': 'Viridis'},
+        'yaxis': {'title': {'text': 'Industry'}, 'automargin': True}
+    })
+
+def _industry_comparison_fig(industry_df, metric, title):
+    """Horizontal bar chart comparing one metric across industries, on a copy of the shared layout"""
+    values = industry_df[metric].to_numpy()
+    fig = go.Figure(_industry_comparison_template())
+    fig.add_bar(
+        x=values,
+        y=industry_df["Industry"].to_numpy(),
+        orientation='h',
+        marker={'color': values, 'coloraxis': 'coloraxis'},
+        hovertemplate=f"{metric}=%{{x}}<br>Industry=%{{y}}<extra></extra>"
+    )
+    fig.update_layout(
+        title={'text': title},
+        xaxis={'title': {'text': metric}},
+        coloraxis_colorbar={'title': {'text': metric}}
+    )
+    return fig
+
+def _industry_companies_fig(industry_df):
+    """Pie chart of the company count per industry"""
+    return _pie_fig(
+        industry_df["Industry"].to_numpy(),
+        industry_df["Companies"].to_numpy(),
+        "Distribution of Companies by Industry",
+        "Industry",
+        "Companies"
+    )
+
 # Initialize session state variables if they don't exist
 if 'email_preferences' not in st.session_state:
     st.session_state.email_preferences = {
@@ -55,7 +551,11 @@ if 'email_preferences' not in st.session_state:
 
 if 'watched_companies' not in st.session_state:
     # Load watched companies from database
-    st.session_state.watched_companies = get_watched_companies()
+    st.session_state.watched_companies = list(_watched_companies())
+
+if 'watched_companies_set' not in st.session_state:
+    # Set mirror of the watchlist for constant-time membership checks
+    st.session_state.watched_companies_set = set(st.session_state.watched_companies)
     
 if 'last_update' not in st.session_state:
     st.session_state.last_update = None
@@ -71,74 +571,29 @@ if 'resume_data' not in st.session_state:
     
 # Initialize achievements and gamification data
 if 'achievements' not in st.session_state:
-    st.session_state.achievements = {
-        'companies_tracked': {
-            'name': 'Company Tracker',
-            'description': 'Track multiple competitor companies',
-            'levels': [
-                {'name': 'Beginner', 'threshold': 1, 'badge': '🥉', 'unlocked': False},
-                {'name': 'Intermediate', 'threshold': 5, 'badge': '🥈', 'unlocked': False},
-                {'name': 'Advanced', 'threshold': 10, 'badge': '🥇', 'unlocked': False},
-                {'name': 'Expert', 'threshold': 25, 'badge': '👑', 'unlocked': False}
-            ],
-            'current_level': 0,
-            'progress': 0,
-            'max': 25
-        },
-        'industries_analyzed': {
-            'name': 'Industry Analyst',
-            'description': 'Analyze different industries for hiring trends',
-            'levels': [
-                {'name': 'Beginner', 'threshold': 1, 'badge': '🥉', 'unlocked': False},
-                {'name': 'Intermediate', 'threshold': 3, 'badge': '🥈', 'unlocked': False},
-                {'name': 'Advanced', 'threshold': 5, 'badge': '🥇', 'unlocked': False},
-                {'name': 'Expert', 'threshold': 7, 'badge': '👑', 'unlocked': False}
-            ],
-            'current_level': 0,
-            'progress': 0,
-            'max': 7
-        },
-        'talent_searches': {
-            'name': 'Talent Scout',
-            'description': 'Search for talent in various locations',
-            'levels': [
-                {'name': 'Beginner', 'threshold': 1, 'badge': '🥉', 'unlocked': False},
-                {'name': 'Intermediate', 'threshold': 5, 'badge': '🥈', 'unlocked': False},
-                {'name': 'Advanced', 'threshold': 15, 'badge': '🥇', 'unlocked': False},
-                {'name': 'Expert', 'threshold': 30, 'badge': '👑', 'unlocked': False}
-            ],
-            'current_level': 0,
-            'progress': 0,
-            'max': 30
-        },
-        'resumes_analyzed': {
-            'name': 'Resume Expert',
-            'description': 'Analyze resumes against job requirements',
-            'levels': [
-                {'name': 'Beginner', 'threshold': 1, 'badge': '🥉', 'unlocked': False},
-                {'name': 'Intermediate', 'threshold': 5, 'badge': '🥈', 'unlocked': False},
-                {'name': 'Advanced', 'threshold': 10, 'badge': '🥇', 'unlocked': False},
-                {'name': 'Expert', 'threshold': 20, 'badge': '👑', 'unlocked': False}
-            ],
-            'current_level': 0,
-            'progress': 0,
-            'max': 20
-        },
-        'insights_generated': {
-            'name': 'Insight Generator',
-            'description': 'Generate hiring insights from data',
-            'levels': [
-                {'name': 'Beginner', 'threshold': 5, 'badge': '🥉', 'unlocked': False},
-                {'name': 'Intermediate', 'threshold': 15, 'badge': '🥈', 'unlocked': False},
-                {'name': 'Advanced', 'threshold': 30, 'badge': '🥇', 'unlocked': False},
-                {'name': 'Expert', 'threshold': 50, 'badge': '👑', 'unlocked': False}
-            ],
-            'current_level': 0,
-            'progress': 0, 
-            'max': 50
-        }
+    # Restore saved achievements, falling back to a fresh copy of the defaults
+    st.session_state.achievements = load_achievements() or copy.deepcopy(DEFAULT_ACHIEVEMENTS)
+    
+    # Sorted level thresholds for locating the reached level with a binary search,
+    # kept apart from the achievements so they aren't saved with them
+    st.session_state.achievement_thresholds = {
+        key: [level['threshold'] for level in achievement['levels']]
+        for key, achievement in st.session_state.achievements.items()
     }
     
+    # Score weights, maxima and progress packed as arrays for the recruitment score
+    achievement_weights = {
+        'companies_tracked': 25,
+        'industries_analyzed': 20,
+        'talent_searches': 15,
+        'resumes_analyzed': 15,
+        'insights_generated': 25
+    }
+    st.session_state.achievement_keys = list(st.session_state.achievements)
+    st.session_state.achievement_weights = np.array([achievement_weights.get(key, 10) for key in st.session_state.achievement_keys], dtype=float)
+    st.session_state.achievement_maxes = np.array([achievement['max'] for achievement in st.session_state.achievements.values()], dtype=float)
+    st.session_state.achievement_progress = np.array([achievement['progress'] for achievement in st.session_state.achievements.values()], dtype=float)
+    
 if 'gamification_stats' not in st.session_state:
     st.session_state.gamification_stats = {
         'recruitment_score': 0,
@@ -153,40 +608,33 @@ def update_achievement_progress(achievement_key, increment=1, check_unlocks=True
     if achievement_key in st.session_state.achievements:
         achievement = st.session_state.achievements[achievement_key]
         achievement['progress'] += increment
+        st.session_state.achievement_progress[st.session_state.achievement_keys.index(achievement_key)] = achievement['progress']
+        st.session_state.achievements_dirty = True
         
-        # Check for level unlocks
+        # Check for level unlocks, unlocking every level passed by a multi-level jump
         if check_unlocks:
-            current_progress = achievement['progress']
-            for i, level in enumerate(achievement['levels']):
-                if current_progress >= level['threshold'] and not level['unlocked']:
+            reached_level = int(np.searchsorted(st.session_state.achievement_thresholds[achievement_key], achievement['progress'], side='right')) - 1
+            if reached_level >= 0 and not achievement['levels'][reached_level]['unlocked']:
+                for level in achievement['levels'][:reached_level + 1]:
                     level['unlocked'] = True
-                    achievement['current_level'] = i
-                    return True, level  # Return unlock info
+                achievement['current_level'] = reached_level
+                return True, achievement['levels'][reached_level]  # Return unlock info
         
         return False, None
     return False, None
 
+def persist_achievements():
+    """Save achievements if they changed since the last save"""
+    # Achievements live in a single app-wide setting, so the last session to save wins;
+    # a reset from one session is overwritten by the next change saved in another
+    if st.session_state.pop('achievements_dirty', False):
+        save_achievements(st.session_state.achievements)
+
 def calculate_recruitment_score():
     """Calculate overall recruitment strategy score based on achievements"""
-    total_score = 0
-    achievement_weights = {
-        'companies_tracked': 25,
-        'industries_analyzed': 20,
-        'talent_searches': 15,
-        'resumes_analyzed': 15,
-        'insights_generated': 25
-    }
-    
-    for key, achievement in st.session_state.achievements.items():
-        # Calculate percentage completion for this achievement
-        max_value = achievement['max']
-        current_value = achievement['progress']
-        completion_pct = min(1.0, current_value / max_value)
-        
-        # Add weighted score
-        total_score += completion_pct * achievement_weights.get(key, 10)
-    
-    return round(total_score)
+    # Weighted sum of each achievement's completion, capped at 100% per achievement
+    completion = np.minimum(1.0, st.session_state.achievement_progress / st.session_state.achievement_maxes)
+    return int(np.round((completion * st.session_state.achievement_weights).sum()))
 
 # Application functions
 def add_company():
@@ -199,12 +647,14 @@ def add_company():
         company_name = st.session_state.new_company
     
     # Add the company if name is provided and not already in the list
-    if company_name and company_name not in st.session_state.watched_companies:
+    if company_name and company_name not in st.session_state.watched_companies_set:
         with st.spinner(f"Adding {company_name} to your watch list..."):
             # Save to database
             success = save_company_to_watch(company_name)
             if success:
+                _watched_companies.clear()
                 st.session_state.watched_companies.append(company_name)
+                st.session_state.watched_companies_set.add(company_name)
                 st.success(f"Added {company_name} to your watch list!")
                 
                 # Update achievements for tracking companies
@@ -223,60 +673,58 @@ def add_company():
 def add_top_companies(count=50):
     """Add top companies to the watchlist"""
     try:
-        # List of predefined top tech companies
-        top_tech_companies = [
-            "Apple", "Microsoft", "Google", "Amazon", "Meta", 
-            "Tesla", "NVIDIA", "Samsung", "Intel", "IBM",
-            "Oracle", "Salesforce", "Adobe", "SAP", "OpenAI",
-            "Palantir", "Snowflake", "Databricks", "Cisco", "ServiceNow",
-            "Sony", "LG Electronics", "Dell Technologies", "HP", "Lenovo",
-            "ASUS", "Xiaomi", "OnePlus", "Huawei", "Razer",
-            "Stripe", "PayPal", "Square", "Robinhood", "Coinbase", 
-            "CrowdStrike", "Darktrace", "Cloudflare", "Okta", "Zscaler",
-            "SpaceX", "Rivian", "Waymo", "ByteDance", "Epic Games",
-            "DeepMind", "Anduril", "QuantumScape", "Boston Dynamics", "Cruise"
-        ]
-        
         # Limit to the requested count
-        companies_to_add = top_tech_companies[:count]
-        added_count = 0
+        companies_to_add = TOP_TECH_COMPANIES[:count]
         
         with st.spinner(f"Adding {len(companies_to_add)} top companies to your watchlist..."):
-            for company_name in companies_to_add:
-                if company_name and company_name not in st.session_state.watched_companies:
-                    # Save to database
-                    success = save_company_to_watch(company_name)
-                    if success:
-                        st.session_state.watched_companies.append(company_name)
-                        added_count += 1
-                        
-                        # Update achievements for tracking companies (without notifications for each company)
-                        if 'achievements' in st.session_state:
-                            update_achievement_progress('companies_tracked', check_unlocks=False)
+            new_companies = [company_name for company_name in companies_to_add 
+                             if company_name and company_name not in st.session_state.watched_companies_set]
+            
+            # Save to database in one batch
+            added_companies = save_companies_to_watch(new_companies)
+            added_count = len(added_companies)
             
-            # Now check for level unlocks once at the end
-            if 'achievements' in st.session_state and added_count > 0:
-                unlocked, level = update_achievement_progress('companies_tracked', increment=0, check_unlocks=True)
-                if unlocked:
-                    st.balloons()
-                    st.success(f"🎉 Achievement Unlocked: Company Tracker - {level['name']} {level['badge']}")
+            if added_count > 0:
+                _watched_companies.clear()
+                st.session_state.watched_companies.extend(added_companies)
+                st.session_state.watched_companies_set.update(added_companies)
                 
-                # Increment total actions
-                if 'gamification_stats' in st.session_state:
-                    st.session_state.gamification_stats['total_actions'] += 1
+                # Update achievements for tracking companies and check for level unlocks once
+                if 'achievements' in st.session_state:
+                    unlocked, level = update_achievement_progress('companies_tracked', increment=added_count)
+                    if unlocked:
+                        st.balloons()
+                        st.success(f"🎉 Achievement Unlocked: Company Tracker - {level['name']} {level['badge']}")
+                    
+                    # Increment total actions
+                    if 'gamification_stats' in st.session_state:
+                        st.session_state.gamification_stats['total_actions'] += 1
                     
             return added_count
     except Exception as e:
         st.error(f"Error adding top companies: {str(e)}")
         return 0
 
-def refresh_data():
-    """Refresh the data from all sources"""
+def refresh_data(quiet=False):
+    """Refresh the data from all sources, without status banners when quiet"""
+    # Skip refreshes of an unchanged watchlist within the same 30-second window
+    fingerprint = (tuple(sorted(st.session_state.watched_companies)), int(time.time()) // 30)
+    if fingerprint == st.session_state.get('last_refresh_fingerprint'):
+        if not quiet:
+            st.info("Data is fresh (last refresh <30s ago)")
+        return
+    
     with st.spinner("Fetching latest hiring data..."):
         # Get real-time job updates for watched companies
         if st.session_state.watched_companies:
-            # Use the real-time job updates function
-            job_updates = get_real_time_job_updates(st.session_state.watched_companies)
+            # Fetch real-time job updates for all companies concurrently; the workers call the
+            # scraper directly, so no Streamlit API runs off the script thread
+            companies = st.session_state.watched_companies
+            with ThreadPoolExecutor(max_workers=min(16, len(companies))) as executor:
+                job_updates = dict(zip(companies, executor.map(
+                    lambda company: get_real_time_job_updates([company]).get(company, []),
+                    companies
+                )))
             
             # Store the job updates in session state
             if 'real_time_job_data' not in st.session_state:
@@ -284,23 +732,47 @@ def refresh_data():
             
             st.session_state.real_time_job_data = job_updates
             
-            # Count new jobs
-            new_jobs_count = sum(
-                len([job for job in jobs if job.get('status') == 'new']) 
-                for jobs in job_updates.values()
-            )
+            # Count jobs once so dashboard reruns can reuse the totals
+            st.session_state.real_time_job_counts = count_jobs(job_updates)
+            new_jobs_count = st.session_state.real_time_job_counts['new']
             
             # Show the count of new jobs
-            if new_jobs_count > 0:
+            if new_jobs_count > 0 and not quiet:
                 st.info(f"Found {new_jobs_count} new job postings!")
                 
         # Update the timestamp
         st.session_state.last_update = datetime.datetime.now()
-    st.success("Data refreshed successfully!")
+    st.session_state.last_refresh_fingerprint = fingerprint
+    if not quiet:
+        st.success("Data refreshed successfully!")
     
+def count_jobs(job_updates):
+    """Count total and new job postings across companies"""
+    return {
+        'total': sum(len(jobs) for jobs in job_updates.values()),
+        'new': sum(1 for jobs in job_updates.values() for job in jobs if job.get('status') == 'new')
+    }
+
+def style_job_status(statuses):
+    """Highlight new and updated job statuses in a column of the job table"""
+    return statuses.map(_STATUS_STYLE).fillna('')
+
+def style_skill_priority(priorities):
+    """Color skill priorities in a column of the priority skills table"""
+    return priorities.map(_SKILL_PRIORITY_STYLE).fillna('')
+
 def change_view(view):
     """Change the current view/tab"""
     st.session_state.current_view = view
+
+def industry_figures(industry_trends, render_key, build_figures):
+    """Industry view figures for a selection, reused from session state until the trend data changes"""
+    render_cache = st.session_state.get('industry_render_cache')
+    if render_cache is None or render_cache['trends'] is not industry_trends:
+        render_cache = st.session_state.industry_render_cache = {'trends': industry_trends, 'figures': {}}
+    if render_key not in render_cache['figures']:
+        render_cache['figures'][render_key] = build_figures()
+    return render_cache['figures'][render_key]
     
 # Sidebar
 with st.sidebar:
@@ -308,18 +780,7 @@ with st.sidebar:
     
     # Navigation
     st.subheader("Navigation")
-    if st.button("📊 Dashboard", use_container_width=True):
-        change_view("dashboard")
-    if st.button("🔎 Company Intelligence", use_container_width=True):
-        change_view("company")
-    if st.button("📄 Resume Analyzer", use_container_width=True):
-        change_view("resume")
-    if st.button("🔍 Talent Demand", use_container_width=True):
-        change_view("talent")
-    if st.button("🎮 Gamification", use_container_width=True):
-        change_view("gamification")
-    if st.button("⚙️ Settings", use_container_width=True):
-        change_view("settings")
+    st.radio("Navigation", options=list(VIEWS), format_func=VIEWS.get, key="current_view", label_visibility="collapsed")
     
     # Company watchlist
     st.subheader("Companies Watchlist")
@@ -330,8 +791,7 @@ with st.sidebar:
     
     # List of watched companies
     if st.session_state.watched_companies:
-        for company in st.session_state.watched_companies:
-            st.write(f"• {company}")
+        st.markdown("\n".join(f"- {company}" for company in st.session_state.watched_companies))
     else:
         st.info("No companies in your watchlist. Add one to get started!")
     
@@ -350,20 +810,11 @@ if st.session_state.current_view == "dashboard":
     
     # Add automatic refresh option
     auto_refresh = st.sidebar.checkbox("Enable Auto-Refresh", value=False)
+    refresh_every = None
     if auto_refresh:
         refresh_interval = st.sidebar.slider("Refresh Interval (minutes)", min_value=1, max_value=60, value=5)
         st.sidebar.caption(f"Data will refresh every {refresh_interval} minutes")
-        
-        # Auto-refresh logic
-        if 'last_auto_refresh' not in st.session_state:
-            st.session_state.last_auto_refresh = time.time()
-            
-        # Check if it's time to refresh
-        current_time = time.time()
-        if current_time - st.session_state.last_auto_refresh >= refresh_interval * 60:
-            # Trigger refresh
-            refresh_data()
-            st.session_state.last_auto_refresh = current_time
+        refresh_every = f"{refresh_interval * 60}s"
     
     if not st.session_state.watched_companies:
         st.info("Add companies to your watchlist to see hiring intelligence.")
@@ -376,149 +827,146 @@ if st.session_state.current_view == "dashboard":
         # Sample visualization to show what the dashboard will look like
         st.subheader("Sample Dashboard Preview")
         # Using demo data for visualization
-        demo_data = get_demo_data()
+        demo_data = _demo_data()
         
         col1, col2 = st.columns(2)
         with col1:
             st.subheader("Hiring Velocity (Sample)")
-            fig = create_hiring_trend_chart(demo_data["hiring_velocity"])
+            fig = _hiring_trend_fig(demo_data["hiring_velocity"])
             st.plotly_chart(fig, use_container_width=True)
             
         with col2:
             st.subheader("Skill Demand (Sample)")
-            fig = create_skill_heatmap(demo_data["skill_demand"])
+            fig = _skill_heatmap_fig(demo_data["skill_demand"])
             st.plotly_chart(fig, use_container_width=True)
             
         st.caption("⚠️ This is sample data. Add companies to your watchlist to see real insights.")
         
     else:
-        # Real dashboard with data from watched companies
-        col1, col2, col3 = st.columns([1, 1, 1])
-        
-        with col1:
-            st.metric(
-                label="Companies Tracked", 
-                value=len(st.session_state.watched_companies),
-                delta=None
-            )
-        
-        # Display real-time job metrics if available
-        if 'real_time_job_data' in st.session_state and st.session_state.real_time_job_data:
-            # Calculate total jobs and new jobs
-            total_jobs = sum(len(jobs) for jobs in st.session_state.real_time_job_data.values())
-            new_jobs = sum(
-                len([job for job in jobs if job.get('status') == 'new']) 
-                for jobs in st.session_state.real_time_job_data.values()
-            )
+        # Real dashboard with data from watched companies, rerun on its own by the auto-refresh timer
+        @st.fragment(run_every=refresh_every)
+        def _realtime_panel():
+            """Render the live metrics, charts and job updates for watched companies"""
+            # Fragment-only reruns come from the auto-refresh timer
+            if not st.session_state.pop('dashboard_full_rerun', False):
+                refresh_data(quiet=True)
+                
+                # The sidebar caption only updates on full reruns, so show the timer's refresh time here
+                if st.session_state.last_update:
+                    st.caption(f"Auto-refreshed: {st.session_state.last_update.strftime('%Y-%m-%d %H:%M')}")
             
-            with col2:
-                st.metric(
-                    label="Roles Monitored", 
-                    value=total_jobs,
-                    delta=f"+{new_jobs} new"
-                )
-        else:
-            with col2:
+            col1, col2, col3 = st.columns([1, 1, 1])
+        
+            with col1:
                 st.metric(
-                    label="Roles Monitored", 
-                    value="0",
+                    label="Companies Tracked", 
+                    value=len(st.session_state.watched_companies),
                     delta=None
                 )
         
-        with col3:
-            # In a real app, we would calculate this from actual data
-            st.metric(
-                label="Detected Trends", 
-                value="4",
-                delta="+2 new"
-            )
+            # Display real-time job metrics if available
+            if 'real_time_job_data' in st.session_state and st.session_state.real_time_job_data:
+                # Total jobs and new jobs, as counted at refresh time
+                if 'real_time_job_counts' not in st.session_state:
+                    st.session_state.real_time_job_counts = count_jobs(st.session_state.real_time_job_data)
+                total_jobs = st.session_state.real_time_job_counts['total']
+                new_jobs = st.session_state.real_time_job_counts['new']
+            
+                with col2:
+                    st.metric(
+                        label="Roles Monitored", 
+                        value=total_jobs,
+                        delta=f"+{new_jobs} new"
+                    )
+            else:
+                with col2:
+                    st.metric(
+                        label="Roles Monitored", 
+                        value="0",
+                        delta=None
+                    )
+        
+            with col3:
+                # In a real app, we would calculate this from actual data
+                st.metric(
+                    label="Detected Trends", 
+                    value="4",
+                    delta="+2 new"
+                )
         
-        # Main dashboard components
-        st.subheader("Hiring Velocity")
+            # Main dashboard components
+            st.subheader("Hiring Velocity")
         
-        # For this example, we'll use the demo data
-        # In a real app, this would be replaced with actual scraped and analyzed data
-        demo_data = get_demo_data()
+            # For this example, we'll use the demo data
+            # In a real app, this would be replaced with actual scraped and analyzed data
+            demo_data = _demo_data()
         
-        # Hiring Trends Chart
-        fig = create_hiring_trend_chart(demo_data["hiring_velocity"])
-        st.plotly_chart(fig, use_container_width=True)
+            # Hiring Trends Chart
+            fig = _hiring_trend_fig(demo_data["hiring_velocity"])
+            st.plotly_chart(fig, use_container_width=True)
         
-        # Real-time job updates section
-        st.subheader("Real-Time Job Updates")
+            # Real-time job updates section
+            st.subheader("Real-Time Job Updates")
         
-        if 'real_time_job_data' in st.session_state and st.session_state.real_time_job_data:
-            # Display the latest job postings with timestamps
-            for company, jobs in st.session_state.real_time_job_data.items():
-                if jobs:  # Only show companies that have jobs
-                    st.write(f"### {company}")
-                    
-                    # Create a table of job listings
-                    job_df = pd.DataFrame([
-                        {
-                            "Job Title": job.get("title", ""),
-                            "Location": job.get("location", ""),
-                            "Status": job.get("status", "").upper(),
-                            "Posted": job.get("posted_time", ""),
-                            "Timestamp": job.get("timestamp", "")
-                        }
-                        for job in jobs[:5]  # Show only the first 5 jobs for each company
-                    ])
+            if 'real_time_job_data' in st.session_state and st.session_state.real_time_job_data:
+                # Display the latest job postings with timestamps
+                for company, jobs in st.session_state.real_time_job_data.items():
+                    if jobs:  # Only show companies that have jobs
+                        st.write(f"### {company}")
                     
-                    # Apply styling based on job status
-                    def highlight_new(val):
-                        if val == "NEW":
-                            return 'background-color: #d4f7dc; font-weight: bold'
-                        elif val == "UPDATED":
-                            return 'background-color: #f7f3d4; font-weight: bold'
-                        else:
-                            return ''
+                        # Create a table of job listings (only the first 5 jobs for each company)
+                        job_df = pd.DataFrame.from_records(jobs[:5], columns=list(JOB_TABLE_COLUMNS)).fillna("")
+                        job_df = job_df.rename(columns=JOB_TABLE_COLUMNS)
+                        job_df["Status"] = job_df["Status"].str.upper()
                     
-                    # Display the styled dataframe
-                    st.dataframe(
-                        job_df.style.applymap(highlight_new, subset=["Status"]), 
-                        use_container_width=True
-                    )
+                        # Display the dataframe styled by job status
+                        st.dataframe(
+                            job_df.style.apply(style_job_status, subset=["Status"]), 
+                            use_container_width=True
+                        )
                     
-                    # Show a view more option if there are more than 5 jobs
-                    if len(jobs) > 5:
-                        st.caption(f"Showing 5 of {len(jobs)} jobs. View Company Intelligence for more.")
-        else:
-            st.info("No real-time job data available yet. Click 'Refresh Data' to fetch the latest job listings.")
+                        # Show a view more option if there are more than 5 jobs
+                        if len(jobs) > 5:
+                            st.caption(f"Showing 5 of {len(jobs)} jobs. View Company Intelligence for more.")
+            else:
+                st.info("No real-time job data available yet. Click 'Refresh Data' to fetch the latest job listings.")
             
-        # Insights from the data
-        st.subheader("Key Insights")
+            # Insights from the data
+            st.subheader("Key Insights")
         
-        col1, col2 = st.columns(2)
+            col1, col2 = st.columns(2)
         
-        with col1:
-            st.info("📈 **Hiring Surge Detected**: Google has increased hiring for AI engineers by 35% in the last month, suggesting a strategic focus on AI capabilities.")
-            st.info("🌎 **Geographic Expansion**: Shopify is hiring more remote roles focused on Latin America, indicating potential market expansion.")
+            with col1:
+                st.info("📈 **Hiring Surge Detected**: Google has increased hiring for AI engineers by 35% in the last month, suggesting a strategic focus on AI capabilities.")
+                st.info("🌎 **Geographic Expansion**: Shopify is hiring more remote roles focused on Latin America, indicating potential market expansion.")
         
-        with col2:
-            st.warning("⚠️ **Leadership Changes**: 3 competitors have posted new CFO positions, potentially indicating preparation for funding rounds or IPO.")
-            st.success("✅ **Opportunity**: Decline in frontend developer hiring across competitors suggests an opportunity to gain UI/UX advantage.")
+            with col2:
+                st.warning("⚠️ **Leadership Changes**: 3 competitors have posted new CFO positions, potentially indicating preparation for funding rounds or IPO.")
+                st.success("✅ **Opportunity**: Decline in frontend developer hiring across competitors suggests an opportunity to gain UI/UX advantage.")
         
-        # Skills heatmap
-        st.subheader("In-Demand Skills Across Competitors")
-        fig = create_skill_heatmap(demo_data["skill_demand"])
-        st.plotly_chart(fig, use_container_width=True)
+            # Skills heatmap
+            st.subheader("In-Demand Skills Across Competitors")
+            fig = _skill_heatmap_fig(demo_data["skill_demand"])
+            st.plotly_chart(fig, use_container_width=True)
         
-        # Geographic distribution
-        st.subheader("Geographic Hiring Focus")
-        fig = create_geo_expansion_map(demo_data["geo_distribution"])
-        st.plotly_chart(fig, use_container_width=True)
+            # Geographic distribution
+            st.subheader("Geographic Hiring Focus")
+            fig = _geo_map_fig(demo_data["geo_distribution"])
+            st.plotly_chart(fig, use_container_width=True)
         
-        # Strategic recommendations
-        st.subheader("Strategic Recommendations")
-        st.markdown("""
-        Based on current hiring patterns:
+            # Strategic recommendations
+            st.subheader("Strategic Recommendations")
+            st.markdown("""
+            Based on current hiring patterns:
         
-        1. **Consider investing in AI capabilities** - Multiple competitors are building AI teams
-        2. **Focus on Latin America market** - Hiring patterns suggest market opportunity
-        3. **Prepare for competitive funding events** - CFO hiring indicates upcoming financial activities
-        4. **Leverage UI/UX as differentiator** - Competitors are under-investing in frontend talent
-        """)
+            1. **Consider investing in AI capabilities** - Multiple competitors are building AI teams
+            2. **Focus on Latin America market** - Hiring patterns suggest market opportunity
+            3. **Prepare for competitive funding events** - CFO hiring indicates upcoming financial activities
+            4. **Leverage UI/UX as differentiator** - Competitors are under-investing in frontend talent
+            """)
+
+        st.session_state.dashboard_full_rerun = True
+        _realtime_panel()
 
 elif st.session_state.current_view == "company":
     st.title("Company Intelligence")
@@ -560,7 +1008,7 @@ elif st.session_state.current_view == "company":
         st.subheader(f"{selected_company} Hiring Intelligence")
         
         # Using demo data for now
-        demo_data = get_demo_data()
+        demo_data = _demo_data()
         company_data = demo_data["company_specific"].get(selected_company, demo_data["company_specific"]["Google"])
         
         # Key metrics
@@ -606,23 +1054,15 @@ elif st.session_state.current_view == "company":
                 # Show a toggle to filter by status
                 show_only_new = st.checkbox("Show only new job postings", value=False)
                 
-                # Filter jobs if requested
-                if show_only_new:
-                    filtered_jobs = [job for job in real_time_jobs if job.get('status') == 'new']
-                else:
-                    filtered_jobs = real_time_jobs
+                # Filter jobs if requested, pairing each job with its display status
+                filtered_jobs = [(job, job.get('status', '').upper()) for job in real_time_jobs
+                                 if not show_only_new or job.get('status') == 'new']
                 
                 if filtered_jobs:
                     # Display jobs in expandable sections
-                    for job in filtered_jobs:
+                    for job, status in filtered_jobs:
                         # Create an expander with the job title and status badge
-                        status = job.get('status', '').upper()
-                        status_color = {
-                            'NEW': '🟢',
-                            'UPDATED': '🟡',
-                            'ACTIVE': '🔵',
-                            'CLOSING SOON': '🟠'
-                        }.get(status, '⚪')
+                        status_color = _STATUS_COLOR.get(status, '⚪')
                         
                         with st.expander(f"{status_color} {job.get('title', 'No Title')} - {job.get('location', 'No Location')}"):
                             # Two columns for job details
@@ -685,6 +1125,9 @@ elif st.session_state.current_view == "company":
                 st.success(insight["text"])
 
 elif st.session_state.current_view == "resume":
+    # Imported here so other views don't pay for the resume analysis module
+    from resume_analyzer import generate_resume_insights, get_career_opportunity_score
+    
     st.title("Resume Analyzer")
     
     st.write("""
@@ -728,22 +1171,27 @@ elif st.session_state.current_view == "resume":
     if upload_method == "Upload File":
         uploaded_file = st.file_uploader("Upload your resume (PDF or TXT file)", type=["pdf", "txt"])
         
-        if uploaded_file:
+        # Reject oversized files before reading them; resumes are only a few pages
+        if uploaded_file and uploaded_file.size > MAX_RESUME_UPLOAD_BYTES:
+            st.error(f"Resume files are limited to {MAX_RESUME_UPLOAD_BYTES // (1024 * 1024)} MB. Try using the 'Paste Text' option instead.")
+        elif uploaded_file:
             try:
-                # Read the content of the uploaded file
+                # Read the content of the uploaded file, parsing it in memory
                 if uploaded_file.type == "application/pdf":
-                    st.warning("PDF parsing is limited in this demo. For best results, use a text file.")
-                    # In a full application, we would use a PDF parser like PyPDF2 or pdfminer
-                    resume_text = "Sample resume content for demonstration"
+                    resume_text = _pdf_text(uploaded_file.getvalue())
+                    if resume_text is None:
+                        # PyMuPDF is optional; without it fall back to sample content
+                        st.warning("PDF parsing is limited in this demo. For best results, use a text file.")
+                        resume_text = "Sample resume content for demonstration"
                 else:  # Text file
-                    resume_text = uploaded_file.getvalue().decode("utf-8")
+                    resume_text = uploaded_file.getvalue().decode("utf-8", errors="replace")
                 
                 # Store the resume text in session state
                 st.session_state.uploaded_resume = resume_text
                 
                 # Process the resume right away
                 with st.spinner("Analyzing your resume..."):
-                    resume_data = extract_resume_content(resume_text)
+                    resume_data = _resume_content(resume_text)
                     st.session_state.resume_data = resume_data
                     show_analysis = True
             except Exception as e:
@@ -751,16 +1199,19 @@ elif st.session_state.current_view == "resume":
     
     # Handle text input method
     elif upload_method == "Paste Text":
-        resume_text = st.text_area("Paste your resume text here:", height=300)
+        # Gate the analysis behind a form so editing the text doesn't rerun the script
+        with st.form("paste_text_form"):
+            resume_text = st.text_area("Paste your resume text here:", height=300)
+            submitted = st.form_submit_button("Analyze Pasted Text")
         
-        if st.button("Analyze Pasted Text"):
+        if submitted:
             if resume_text.strip():
                 # Store the resume text in session state
                 st.session_state.uploaded_resume = resume_text
                 
                 # Process the resume right away
                 with st.spinner("Analyzing your resume..."):
-                    resume_data = extract_resume_content(resume_text)
+                    resume_data = _resume_content(resume_text)
                     st.session_state.resume_data = resume_data
                     show_analysis = True
             else:
@@ -768,9 +1219,11 @@ elif st.session_state.current_view == "resume":
                 
     # Handle LinkedIn URL method        
     elif upload_method == "LinkedIn URL":
-        linkedin_url = st.text_input("Enter your LinkedIn profile URL:", placeholder="https://www.linkedin.com/in/yourprofile/")
+        with st.form("linkedin_url_form"):
+            linkedin_url = st.text_input("Enter your LinkedIn profile URL:", placeholder="https://www.linkedin.com/in/yourprofile/")
+            submitted = st.form_submit_button("Analyze LinkedIn Profile")
         
-        if st.button("Analyze LinkedIn Profile"):
+        if submitted:
             if linkedin_url.strip():
                 st.session_state.uploaded_resume = linkedin_url
                 
@@ -779,40 +1232,11 @@ elif st.session_state.current_view == "resume":
                         # In a real application, we would use LinkedIn API or web scraping
                         # For this demo, we'll simulate extracting profile data
                         st.info("⚠️ LinkedIn profile extraction is simulated in this demo environment.")
-                        
-                        # Generate sample data based on URL
-                        profile_name = linkedin_url.split("/")[-1].replace("-", " ").title()
-                        if not profile_name or profile_name == "":
-                            profile_name = "Demo Profile"
-                            
-                        # Create simulated resume content
-                        resume_text = f"""
-                        {profile_name}
-                        
-                        SKILLS
-                        Python, Data Analysis, Machine Learning, JavaScript, React, SQL, AWS, Leadership
-                        
-                        EXPERIENCE
-                        Senior Data Analyst at TechCorp (2019 - Present)
-                        - Led data analysis initiatives for enterprise clients
-                        - Developed predictive models using machine learning
-                        
-                        Data Scientist at Innovation Labs (2017 - 2019)
-                        - Built data pipelines for processing large datasets
-                        - Collaborated with cross-functional teams on AI projects
-                        
-                        EDUCATION
-                        M.S. in Computer Science, Stanford University (2015-2017)
-                        B.S. in Statistics, UC Berkeley (2011-2015)
-                        
-                        PROJECTS
-                        Smart City Data Analysis
-                        Customer Segmentation Algorithm
-                        """
+                        resume_text = _linkedin_profile_text(linkedin_url)
                         
                         # Store and process the resume
                         st.session_state.uploaded_resume = resume_text
-                        resume_data = extract_resume_content(resume_text)
+                        resume_data = _resume_content(resume_text)
                         st.session_state.resume_data = resume_data
                         show_analysis = True
                         
@@ -872,49 +1296,32 @@ elif st.session_state.current_view == "resume":
         if submitted:
             if name and title and skills_input:
                 # Create structured resume from template
-                skills_list = [skill.strip() for skill in skills_input.split(",")]
-                
-                resume_text = f"""
-                {name}
-                {title}
-                {location}
-                {email}
-                
-                SKILLS
-                {skills_input}
+                resume_lines = [name, title, location, email, "", "SKILLS", skills_input, "", "EXPERIENCE"]
                 
-                EXPERIENCE
-                """
-                
-                # Add Job #1
-                if job1_title and job1_company:
-                    resume_text += f"\n{job1_title} at {job1_company} ({job1_dates})\n"
-                    if job1_description:
-                        # Use safer string manipulation to add bullet points
-                        bullet_text = "- " + job1_description.replace("\n", "\n- ")
-                        resume_text += bullet_text + "\n"
-                
-                # Add Job #2
-                if job2_title and job2_company:
-                    resume_text += f"\n{job2_title} at {job2_company} ({job2_dates})\n"
-                    if job2_description:
-                        # Use safer string manipulation to add bullet points
-                        bullet_text = "- " + job2_description.replace("\n", "\n- ")
-                        resume_text += bullet_text + "\n"
+                # Add each job with its description lines as bullet points
+                for job_title, job_company, job_dates, job_description in (
+                    (job1_title, job1_company, job1_dates, job1_description),
+                    (job2_title, job2_company, job2_dates, job2_description)
+                ):
+                    if job_title and job_company:
+                        resume_lines += ["", f"{job_title} at {job_company} ({job_dates})"]
+                        resume_lines.extend(f"- {line}" for line in job_description.splitlines())
                 
                 # Add Education
                 if edu_degree and edu_school:
-                    resume_text += f"\nEDUCATION\n{edu_degree}, {edu_school} ({edu_dates})\n"
+                    resume_lines += ["", "EDUCATION", f"{edu_degree}, {edu_school} ({edu_dates})"]
                 
                 # Add Projects
                 if projects:
-                    resume_text += f"\nPROJECTS\n{projects}\n"
+                    resume_lines += ["", "PROJECTS", projects]
+                
+                resume_text = "\n".join(resume_lines)
                 
                 # Store and process the resume
                 st.session_state.uploaded_resume = resume_text
                 
                 with st.spinner("Analyzing your resume..."):
-                    resume_data = extract_resume_content(resume_text)
+                    resume_data = _resume_content(resume_text)
                     st.session_state.resume_data = resume_data
                     show_analysis = True
             else:
@@ -941,280 +1348,203 @@ elif st.session_state.current_view == "resume":
         skill_cols = st.columns(3)
         skills_per_col = len(resume_data["skills"]) // 3 + 1
         
-        for i, skill in enumerate(resume_data["skills"]):
-            col_idx = i // skills_per_col
-            with skill_cols[min(col_idx, 2)]:
-                st.write(f"✓ {skill}")
+        # Fill the columns in order, writing each column's skills in one markdown call
+        for col_idx, skill_col in enumerate(skill_cols):
+            col_skills = resume_data["skills"][col_idx * skills_per_col:(col_idx + 1) * skills_per_col]
+            if col_skills:
+                skill_col.markdown("\n\n".join(f"✓ {skill}" for skill in col_skills))
         
         # Match against company job listings
         if st.session_state.watched_companies:
             st.subheader("Resume Match Analysis")
             
             # Get demo data for now (in a real app, this would use actual job listings)
-            demo_data = get_demo_data()
+            demo_data = _demo_data()
+            
+            # Analyze resume against each company's jobs once, for the selected company and the development plan
+            company_specific = demo_data["company_specific"]
+            matches_by_company = {
+                company: _resume_job_matches(resume_data, company_specific.get(company, company_specific["Google"])["recent_jobs"])
+                for company in st.session_state.watched_companies
+            }
             
-            # Create tabs for each watched company
-            company_tabs = st.tabs(st.session_state.watched_companies)
+            # Render match details for the selected company only, rather than a tab per company;
+            # as a fragment, picking another company reruns just this section
+            @st.fragment
+            def _company_match_details():
+                """Render the resume match breakdown for the selected watched company"""
+                company = st.selectbox(
+                    "Select a company to compare your resume against:",
+                    options=st.session_state.watched_companies,
+                    key="resume_match_company"
+                )
+                job_matches = matches_by_company[company]
+            
+                # Show overall match score
+                opportunity_score = get_career_opportunity_score(job_matches)
+            
+                st.metric(
+                    label=f"Overall Match with {company}", 
+                    value=f"{opportunity_score:.1f}%"
+                )
             
-            for i, company in enumerate(st.session_state.watched_companies):
-                with company_tabs[i]:
-                    # Get company job data
-                    company_data = demo_data["company_specific"].get(company, demo_data["company_specific"]["Google"])
+                # Display top matches with enhanced visualization
+                st.subheader("Top Job Matches")
+                for job_match in job_matches[:3]:  # Show top 3 matches
+                    # Set color based on match quality
+                    quality_color = _QUALITY_COLOR.get(job_match.get("match_quality", ""), "red")
                     
-                    # Analyze resume against company jobs
-                    job_matches = analyze_resume_vs_company_jobs(resume_data, company_data["recent_jobs"])
+                    # Create an expander with colored heading
+                    with st.expander(f"{job_match['job_title']} (:{quality_color}[{job_match['match_percentage']:.1f}% match])"):
+                        # Top metrics for the job match
+                        cols = st.columns(3)
+                        with cols[0]:
+                            st.metric("Match Quality", job_match.get("match_quality", "N/A"))
                     
-                    # Show overall match score
-                    opportunity_score = get_career_opportunity_score(job_matches)
+                        with cols[1]:
+                            skill_coverage = job_match.get("skill_coverage", {})
+                            ratio = skill_coverage.get("skill_match_ratio", "0/0") if skill_coverage else "0/0"
+                            st.metric("Skills Match", ratio)
                     
-                    st.metric(
-                        label=f"Overall Match with {company}", 
-                        value=f"{opportunity_score:.1f}%"
-                    )
+                        with cols[2]:
+                            posted_date = job_match.get("posted_date", "")
+                            posted_text = f"Posted {posted_date}" if posted_date else "Recent"
+                            st.metric("Status", posted_text)
+                        
+                        # Job details
+                        st.markdown("---")
+                        st.write(f"**Department:** {job_match['job_department']}")
+                        st.write(f"**Location:** {job_match['job_location']}")
                     
-                    # Display top matches with enhanced visualization
-                    st.subheader("Top Job Matches")
-                    for job_match in job_matches[:3]:  # Show top 3 matches
-                        # Set color based on match quality
-                        match_quality = job_match.get("match_quality", "")
-                        if match_quality == "Excellent":
-                            quality_color = "green"
-                        elif match_quality == "Good":
-                            quality_color = "blue"
-                        elif match_quality == "Fair": 
-                            quality_color = "orange"
-                        else:
-                            quality_color = "red"
-                            
-                        # Create an expander with colored heading
-                        with st.expander(f"{job_match['job_title']} ({job_match['match_percentage']:.1f}% match)"):
-                            # Top metrics for the job match
-                            cols = st.columns(3)
-                            with cols[0]:
-                                st.metric("Match Quality", job_match.get("match_quality", "N/A"))
-                            
-                            with cols[1]:
-                                skill_coverage = job_match.get("skill_coverage", {})
-                                ratio = skill_coverage.get("skill_match_ratio", "0/0") if skill_coverage else "0/0"
-                                st.metric("Skills Match", ratio)
-                            
-                            with cols[2]:
-                                posted_date = job_match.get("posted_date", "")
-                                posted_text = f"Posted {posted_date}" if posted_date else "Recent"
-                                st.metric("Status", posted_text)
-                                
-                            # Job details
-                            st.markdown("---")
-                            st.write(f"**Department:** {job_match['job_department']}")
-                            st.write(f"**Location:** {job_match['job_location']}")
-                            
-                            if job_match.get("salary_range"):
-                                st.write(f"**Salary Range:** {job_match['salary_range']}")
+                        if job_match.get("salary_range"):
+                            st.write(f"**Salary Range:** {job_match['salary_range']}")
+                        
+                        # Skills section with columns
+                        st.markdown("---")
+                        st.subheader("Skills Analysis")
+                    
+                        skill_cols = st.columns(3)
+                    
+                        with skill_cols[0]:
+                            st.write("**✓ Matching Skills:**")
+                            for skill in job_match["matching_skills"]:
+                                st.markdown(f"<span style='color:green'>✓ {skill}</span>", unsafe_allow_html=True)
+                    
+                        with skill_cols[1]:
+                            if job_match.get("partial_matching_skills"):
+                                st.write("**~ Partial Matches:**")
+                                for skill in job_match["partial_matching_skills"]:
+                                    st.markdown(f"<span style='color:orange'>~ {skill}</span>", unsafe_allow_html=True)
+                    
+                        with skill_cols[2]:
+                            if job_match["missing_skills"]:
+                                st.write("**○ Skills to Develop:**")
+                                for skill in job_match["missing_skills"][:5]:  # Limit to 5 to avoid overwhelming
+                                    st.markdown(f"<span style='color:red'>○ {skill}</span>", unsafe_allow_html=True)
                                 
-                            # Skills section with columns
+                        # Add visual skill coverage meter if available
+                        if job_match.get("skill_coverage"):
+                            sc = job_match["skill_coverage"]
                             st.markdown("---")
-                            st.subheader("Skills Analysis")
-                            
-                            skill_cols = st.columns(3)
-                            
-                            with skill_cols[0]:
-                                st.write("**✓ Matching Skills:**")
-                                for skill in job_match["matching_skills"]:
-                                    st.markdown(f"<span style='color:green'>✓ {skill}</span>", unsafe_allow_html=True)
-                            
-                            with skill_cols[1]:
-                                if job_match.get("partial_matching_skills"):
-                                    st.write("**~ Partial Matches:**")
-                                    for skill in job_match["partial_matching_skills"]:
-                                        st.markdown(f"<span style='color:orange'>~ {skill}</span>", unsafe_allow_html=True)
-                            
-                            with skill_cols[2]:
-                                if job_match["missing_skills"]:
-                                    st.write("**○ Skills to Develop:**")
-                                    for skill in job_match["missing_skills"][:5]:  # Limit to 5 to avoid overwhelming
-                                        st.markdown(f"<span style='color:red'>○ {skill}</span>", unsafe_allow_html=True)
-                                        
-                            # Add visual skill coverage meter if available
-                            if job_match.get("skill_coverage"):
-                                sc = job_match["skill_coverage"]
-                                st.markdown("---")
-                                st.subheader("Skill Coverage Metrics")
-                                
-                                # Create a progress bar for skill coverage
-                                exact = sc.get("exact_match_count", 0)
-                                partial = sc.get("partial_match_count", 0)
-                                total = sc.get("total_required", 1)  # Avoid division by zero
-                                
-                                coverage_pct = min(100, int((exact + (partial * 0.5)) / total * 100)) if total > 0 else 0
-                                st.progress(coverage_pct / 100)
-                                
-                                # Display skill metrics
-                                metric_cols = st.columns(4)
-                                with metric_cols[0]:
-                                    st.metric("Exact Matches", exact)
-                                with metric_cols[1]:
-                                    st.metric("Partial Matches", partial)
-                                with metric_cols[2]:
-                                    st.metric("Missing Skills", sc.get("missing_count", 0))
-                                with metric_cols[3]:
-                                    st.metric("Total Required", total)
-                    
-                    # Generate and display insights
-                    insights = generate_resume_insights(resume_data, job_matches)
-                    if insights:
-                        st.subheader("Career Insights")
-                        for insight in insights:
-                            st.info(insight)
+                            st.subheader("Skill Coverage Metrics")
+                        
+                            # Create a progress bar for skill coverage
+                            exact = sc.get("exact_match_count", 0)
+                            partial = sc.get("partial_match_count", 0)
+                            total = sc.get("total_required", 1)  # Avoid division by zero
+                        
+                            coverage_pct = min(100, int((exact + (partial * 0.5)) / total * 100)) if total > 0 else 0
+                            st.progress(coverage_pct / 100)
+                        
+                            # Display skill metrics
+                            metric_cols = st.columns(4)
+                            with metric_cols[0]:
+                                st.metric("Exact Matches", exact)
+                            with metric_cols[1]:
+                                st.metric("Partial Matches", partial)
+                            with metric_cols[2]:
+                                st.metric("Missing Skills", sc.get("missing_count", 0))
+                            with metric_cols[3]:
+                                st.metric("Total Required", total)
+            
+                # Generate and display insights
+                insights = generate_resume_insights(resume_data, job_matches)
+                if insights:
+                    st.subheader("Career Insights")
+                    for insight in insights:
+                        st.info(insight)
+            
+            _company_match_details()
             
             # Overall recommendations across companies with enhanced visualization
             st.subheader("Strategic Career Development Plan")
             
-            # Collect all missing skills across top matches
-            all_missing_skills = {}
-            for company in st.session_state.watched_companies:
-                company_data = demo_data["company_specific"].get(company, demo_data["company_specific"]["Google"])
-                job_matches = analyze_resume_vs_company_jobs(resume_data, company_data["recent_jobs"])
-                
-                for job_match in job_matches[:2]:  # Consider top 2 matches from each company
-                    for skill in job_match["missing_skills"]:
-                        if skill in all_missing_skills:
-                            all_missing_skills[skill] += 1
-                        else:
-                            all_missing_skills[skill] = 1
+            # Count missing skills across the top 2 matches from each company
+            all_missing_skills = Counter(chain.from_iterable(
+                job_match["missing_skills"]
+                for job_matches in matches_by_company.values()
+                for job_match in job_matches[:2]
+            ))
             
             # Sort by frequency and display top skills to develop
             if all_missing_skills:
-                sorted_skills = sorted(all_missing_skills.items(), key=lambda x: x[1], reverse=True)
+                top_skills = all_missing_skills.most_common(5)
                 
                 # Display skills to develop in a visually appealing way
-                st.markdown("""
-                <div style="background-color:#f8f9fa; padding:15px; border-radius:10px; margin-bottom:15px;">
-                    <h3 style="color:#0066cc;">🎯 Priority Skills to Develop</h3>
-                    <p>Based on your resume analysis across all companies, these skills would most significantly improve your marketability:</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(PRIORITY_SKILLS_HEADER_HTML, unsafe_allow_html=True)
                 
                 # Create a skill priority table
                 skill_data = []
-                for skill, count in sorted_skills[:5]:  # Top 5
-                    priority = "High" if count > 2 else ("Medium" if count > 1 else "Normal")
-                    priority_color = "#ff4b4b" if count > 2 else ("#ff9d45" if count > 1 else "#2986cc")
-                    skill_data.append({
-                        "Skill": skill,
-                        "Demand": f"{count} roles",
-                        "Priority": priority,
-                        "color": priority_color
-                    })
-                
-                # Display as custom HTML table
-                st.markdown("<table width='100%' style='text-align:left; border-collapse:separate; border-spacing:0 8px;'>", unsafe_allow_html=True)
-                st.markdown("<tr><th>Skill</th><th>Demand</th><th>Priority</th><th>Learning Resources</th></tr>", unsafe_allow_html=True)
-                
-                for item in skill_data:
+                for skill, count in top_skills:
+                    priority = next((label for min_count, label in _SKILL_PRIORITIES if count > min_count), "Normal")
+                    
                     # Generate simulated learning resource suggestion based on skill
-                    learning_resource = "Online Course" if "python" in item["Skill"].lower() or "javascript" in item["Skill"].lower() else (
-                        "Certification" if "aws" in item["Skill"].lower() or "cloud" in item["Skill"].lower() else 
+                    learning_resource = "Online Course" if _COURSE_SKILL_RE.search(skill) else (
+                        "Certification" if _CERTIFICATION_SKILL_RE.search(skill) else 
                         "Workshop/Practice"
                     )
                     
-                    st.markdown(f"""
-                    <tr style="background-color:#f8f9fa;">
-                        <td style="padding:10px;"><b>{item["Skill"]}</b></td>
-                        <td style="padding:10px;">{item["Demand"]}</td>
-                        <td style="padding:10px;"><span style="color:{item["color"]}; font-weight:bold;">{item["Priority"]}</span></td>
-                        <td style="padding:10px;">{learning_resource}</td>
-                    </tr>
-                    """, unsafe_allow_html=True)
+                    skill_data.append({
+                        "Skill": skill,
+                        "Demand": count,
+                        "Priority": priority,
+                        "Learning Resources": learning_resource
+                    })
                 
-                st.markdown("</table>", unsafe_allow_html=True)
+                # Display as a native table, styled by priority
+                skill_df = pd.DataFrame(skill_data)
+                st.dataframe(
+                    skill_df.style.apply(style_skill_priority, subset=["Priority"]),
+                    column_config={
+                        "Demand": st.column_config.NumberColumn(format="%d roles", help="Top job matches missing this skill")
+                    },
+                    hide_index=True,
+                    use_container_width=True
+                )
                 
                 # Create a development timeline
-                st.markdown("""
-                <div style="background-color:#f8f9fa; padding:15px; border-radius:10px; margin:20px 0;">
-                    <h3 style="color:#0066cc;">📅 Development Timeline</h3>
-                    <p>A suggested timeline for skill acquisition based on priority:</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(DEVELOPMENT_TIMELINE_HEADER_HTML, unsafe_allow_html=True)
                 
-                # Create columns for timeline visualization
+                # Create columns for timeline visualization, listing each priority's skills in one markdown call
                 timeline_cols = st.columns(3)
                 
-                with timeline_cols[0]:
-                    st.markdown("""
-                    <div style="border-left:3px solid #ff4b4b; padding-left:10px; margin-bottom:15px;">
-                        <h4>Short-term (1-3 months)</h4>
-                        <ul style="padding-left:15px;">
-                    """, unsafe_allow_html=True)
-                    
-                    # Add high priority skills
-                    for item in skill_data:
-                        if item["Priority"] == "High":
-                            st.markdown(f"<li>{item['Skill']}</li>", unsafe_allow_html=True)
-                    
-                    st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                with timeline_cols[1]:
-                    st.markdown("""
-                    <div style="border-left:3px solid #ff9d45; padding-left:10px; margin-bottom:15px;">
-                        <h4>Mid-term (3-6 months)</h4>
-                        <ul style="padding-left:15px;">
-                    """, unsafe_allow_html=True)
-                    
-                    # Add medium priority skills
-                    for item in skill_data:
-                        if item["Priority"] == "Medium":
-                            st.markdown(f"<li>{item['Skill']}</li>", unsafe_allow_html=True)
-                    
-                    st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                with timeline_cols[2]:
-                    st.markdown("""
-                    <div style="border-left:3px solid #2986cc; padding-left:10px; margin-bottom:15px;">
-                        <h4>Long-term (6+ months)</h4>
-                        <ul style="padding-left:15px;">
-                    """, unsafe_allow_html=True)
-                    
-                    # Add normal priority skills
-                    for item in skill_data:
-                        if item["Priority"] == "Normal":
-                            st.markdown(f"<li>{item['Skill']}</li>", unsafe_allow_html=True)
-                    
-                    st.markdown("</ul></div>", unsafe_allow_html=True)
+                for timeline_col, (priority, border_color, period) in zip(timeline_cols, TIMELINE_STAGES):
+                    skill_items = "".join(f"<li>{item['Skill']}</li>" for item in skill_data if item["Priority"] == priority)
+                    timeline_col.markdown(
+                        TIMELINE_COLUMN_HTML.format(border_color=border_color, period=period, skill_items=skill_items),
+                        unsafe_allow_html=True
+                    )
                 
                 # General career development recommendations
-                st.markdown("""
-                <div style="background-color:#f8f9fa; padding:15px; border-radius:10px; margin:20px 0;">
-                    <h3 style="color:#0066cc;">📋 General Career Development Recommendations</h3>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(CAREER_RECOMMENDATIONS_HEADER_HTML, unsafe_allow_html=True)
                 
                 rec_cols = st.columns(2)
                 
                 with rec_cols[0]:
-                    st.markdown("""
-                    <div style="background-color:#ffffff; padding:15px; border-radius:10px; height:100%;">
-                        <h4>Resume Enhancement</h4>
-                        <ul>
-                            <li>Tailor your resume for specific job applications</li>
-                            <li>Quantify achievements with metrics where possible</li>
-                            <li>Highlight projects that demonstrate your skills</li>
-                            <li>Use action verbs and industry keywords</li>
-                        </ul>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(RESUME_ENHANCEMENT_HTML, unsafe_allow_html=True)
                 
                 with rec_cols[1]:
-                    st.markdown("""
-                    <div style="background-color:#ffffff; padding:15px; border-radius:10px; height:100%;">
-                        <h4>Professional Development</h4>
-                        <ul>
-                            <li>Focus on developing the most in-demand skills</li>
-                            <li>Build a portfolio showcasing your abilities</li>
-                            <li>Network with professionals in target companies</li>
-                            <li>Contribute to open-source or community projects</li>
-                        </ul>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(PROFESSIONAL_DEVELOPMENT_HTML, unsafe_allow_html=True)
         else:
             st.info("Add companies to your watchlist to see how your resume matches against their job requirements.")
     else:
@@ -1233,10 +1563,10 @@ elif st.session_state.current_view == "talent":
     - Analyze industry hiring trends from company data
     """)
     
-    # Industry analysis option
-    tabs = st.tabs(["Job Role Analysis", "Industry Hiring Trends"])
-    
-    with tabs[0]:
+    # Each tab body is a fragment, so its widgets rerun just that tab
+    @st.fragment
+    def _render_talent_tab():
+        """Render the job role talent analysis form and results"""
         # Job Role Analysis functionality
         st.subheader("Job Role Talent Analysis")
         st.write("Analyze talent availability for specific job roles and skills.")
@@ -1265,33 +1595,38 @@ elif st.session_state.current_view == "talent":
         if submitted and job_role and location:
             # Store unique locations searched
             if 'talent_locations_searched' not in st.session_state:
-                st.session_state.talent_locations_searched = set()
+                st.session_state.talent_locations_searched = set(
+                    st.session_state.achievements['talent_searches'].get('locations_searched', [])
+                )
             
             # Show results
             with st.spinner(f"Analyzing talent market for {job_role} in {location}..."):
-                # Add to set of locations searched
-                st.session_state.talent_locations_searched.add(location)
-                
-                # Update achievements for talent searches
-                if 'achievements' in st.session_state:
-                    # Only count unique locations
-                    if len(st.session_state.talent_locations_searched) > st.session_state.achievements['talent_searches']['progress']:
-                        unlocked, level = update_achievement_progress('talent_searches')
-                        
-                        if unlocked:
-                            st.balloons()
-                            st.success(f"🎉 Achievement Unlocked: Talent Scout - {level['name']} {level['badge']}")
-                        
-                        # Increment total actions
-                        if 'gamification_stats' in st.session_state:
-                            st.session_state.gamification_stats['total_actions'] += 1
+                # Achievement bookkeeping only runs when the query changes, not on resubmits
+                if st.session_state.get('last_talent_query') != (job_role, location):
+                    st.session_state.last_talent_query = (job_role, location)
+                    
+                    # Update achievements for talent searches
+                    if 'achievements' in st.session_state:
+                        # Only count unique locations, including those saved from earlier sessions
+                        if location not in st.session_state.talent_locations_searched:
+                            st.session_state.talent_locations_searched.add(location)
+                            st.session_state.achievements['talent_searches'].setdefault('locations_searched', []).append(location)
+                            unlocked, level = update_achievement_progress('talent_searches')
+                            
+                            if unlocked:
+                                st.balloons()
+                                st.success(f"🎉 Achievement Unlocked: Talent Scout - {level['name']} {level['badge']}")
+                            
+                            # Increment total actions
+                            if 'gamification_stats' in st.session_state:
+                                st.session_state.gamification_stats['total_actions'] += 1
                 
                 # Get talent availability data
                 if not skills:
                     # Default skills if none provided
                     skills = ["Programming", "Communication", "Problem Solving"]
                     
-                talent_data = analyze_talent_availability(job_role, location, skills)
+                talent_data = _talent_availability(job_role, location, tuple(sorted(skills)))
                 
                 # Display key metrics
                 st.subheader("Talent Availability")
@@ -1330,49 +1665,32 @@ elif st.session_state.current_view == "talent":
                     # Create a table of top cities
                     city_data = pd.DataFrame(talent_data["top_cities"])
                     
-                    # Format the numbers with commas
-                    city_data["talent_count"] = city_data["talent_count"].apply(lambda x: f"{x:,}")
+                    # Format the numbers with commas; categorical cities are dictionary-encoded for the browser
+                    city_data["talent_count"] = city_data["talent_count"].map("{:,}".format)
+                    city_data["city"] = city_data["city"].astype("category")
                     
                     # Rename columns for display
                     city_data.columns = ["City", "Available Talent", "Annual Growth (%)"]
                     
-                    # Display as a table
-                    st.table(city_data)
+                    # Display as a native table
+                    st.dataframe(city_data, hide_index=True, use_container_width=True)
                     
                     # Add a note about talent mobility
-                    st.info(f"💡 **Insight:** {talent_data['top_cities'][0]['city']} has the highest concentration of {job_role} talent with a growth rate of {talent_data['top_cities'][0]['growth_rate']}% annually.")
+                    st.info(f"💡 **Insight:** {talent_data['top_cities']['city'][0]} has the highest concentration of {job_role} talent with a growth rate of {talent_data['top_cities']['growth_rate'][0]}% annually.")
                 
                 # Tab 2: Skill Analysis
                 with talent_tabs[1]:
                     st.subheader("Skill Prevalence Analysis")
                     
                     # Create a DataFrame for the skills
-                    skill_data = pd.DataFrame(talent_data["skill_prevalence"])
+                    # Sort once by prevalence (lowest first); the chart orders its bars itself
+                    skill_data = pd.DataFrame(talent_data["skill_prevalence"]).sort_values(by="prevalence")
                     
-                    # Sort by prevalence (highest first)
-                    skill_data = skill_data.sort_values(by="prevalence", ascending=False)
+                    # Display a horizontal bar chart
+                    st.plotly_chart(_skill_prevalence_fig(skill_data, job_role), use_container_width=True)
                     
-                    # Create a horizontal bar chart
-                    fig = px.bar(
-                        skill_data,
-                        y="skill",
-                        x="prevalence",
-                        title=f"Skill Prevalence for {job_role} (% of candidates)",
-                        labels={"prevalence": "% of Candidates", "skill": "Skill"},
-                        orientation='h',
-                        color="prevalence",
-                        color_continuous_scale="Viridis",
-                        range_color=[0, 100]
-                    )
-                    
-                    # Update layout
-                    fig.update_layout(yaxis={'categoryorder':'total ascending'})
-                    
-                    # Display the chart
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Identify skill gaps (skills with low prevalence = opportunity)
-                    rare_skills = skill_data[skill_data["prevalence"] < 40].sort_values(by="prevalence")
+                    # Identify skill gaps (skills with low prevalence = opportunity), already in ascending order
+                    rare_skills = skill_data[skill_data["prevalence"].lt(40)]
                     if not rare_skills.empty:
                         rare_skill_names = ", ".join(rare_skills["skill"].tolist())
                         st.success(f"💡 **Opportunity:** The skills '{rare_skill_names}' are in demand but less common among candidates, potentially making them valuable differentiators for your company.")
@@ -1384,37 +1702,33 @@ elif st.session_state.current_view == "talent":
                     # Create a DataFrame for competing companies
                     competing_companies = pd.DataFrame(talent_data["competing_companies"])
                     
-                    # Create bar chart for hiring volume
-                    fig = px.bar(
-                        competing_companies,
-                        x="name",
-                        y="role_count",
-                        title=f"Companies Hiring {job_role} Talent",
-                        labels={"name": "Company", "role_count": "Monthly Job Postings"},
-                        color="role_count",
-                        color_continuous_scale="Viridis",
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
+                    # Bar chart for hiring volume
+                    st.plotly_chart(_competing_companies_fig(competing_companies, job_role), use_container_width=True)
                     
                     # Display competitor details
                     st.subheader("Competitor Hiring Details")
                     
                     # Calculate market share percentages based on role count
                     total_roles = competing_companies["role_count"].sum()
-                    competing_companies["market_share"] = (competing_companies["role_count"] / total_roles * 100).round(1)
-                    competing_companies["market_share"] = competing_companies["market_share"].apply(lambda x: f"{x}%")
-                    
-                    # Rename columns for display
-                    display_companies = competing_companies.copy()
-                    display_companies.columns = ["Company", "Hiring Velocity", "Monthly Job Postings", "Market Share (%)"]
+                    market_share = np.round(competing_companies["role_count"].to_numpy(dtype=float) / total_roles * 100, 1)
+                    competing_companies["market_share"] = np.char.add(market_share.astype(str), "%")
                     
-                    # Display as a table
-                    st.table(display_companies)
+                    # Display as a native table with readable column names
+                    competing_companies["name"] = competing_companies["name"].astype("category")
+                    st.dataframe(
+                        competing_companies.rename(columns={
+                            "name": "Company",
+                            "hiring_velocity": "Hiring Velocity",
+                            "role_count": "Monthly Job Postings",
+                            "market_share": "Market Share (%)"
+                        }),
+                        hide_index=True,
+                        use_container_width=True
+                    )
                     
                     # Add insights
-                    top_competitor = talent_data["competing_companies"][0]["name"]
-                    top_volume = talent_data["competing_companies"][0]["role_count"]
+                    top_competitor = talent_data["competing_companies"]["name"][0]
+                    top_volume = talent_data["competing_companies"]["role_count"][0]
                     st.info(f"💡 **Insight:** {top_competitor} is the most active competitor hiring for {job_role} positions with approximately {top_volume} new job postings per month.")
                 
                 # Tab 4: Demographics
@@ -1427,29 +1741,13 @@ elif st.session_state.current_view == "talent":
                     with col1:
                         # Education breakdown pie chart
                         education_df = pd.DataFrame(talent_data["education_breakdown"])
-                        
-                        fig = px.pie(
-                            education_df,
-                            values="percentage",
-                            names="level",  # Changed from "education_level" to "level" to match the column name
-                            title=f"Education Level Distribution for {job_role}",
-                            hole=0.4,
-                        )
-                        
+                        fig = _level_distribution_fig(education_df, f"Education Level Distribution for {job_role}")
                         st.plotly_chart(fig, use_container_width=True)
                     
                     with col2:
                         # Experience distribution pie chart
                         experience_df = pd.DataFrame(talent_data["experience_levels"])
-                        
-                        fig = px.pie(
-                            experience_df,
-                            values="percentage",
-                            names="level",  # Changed from "experience_level" to "level" to match the column name
-                            title=f"Experience Level Distribution for {job_role}",
-                            hole=0.4,
-                        )
-                        
+                        fig = _level_distribution_fig(experience_df, f"Experience Level Distribution for {job_role}")
                         st.plotly_chart(fig, use_container_width=True)
                     
                     # Remote work availability
@@ -1466,43 +1764,40 @@ elif st.session_state.current_view == "talent":
                     }
                     
                     remote_df = pd.DataFrame(remote_data)
-                    
-                    fig = px.pie(
-                        remote_df,
-                        values="Percentage",
-                        names="Work Type",
-                        title=f"Work Location Preferences for {job_role} Talent",
-                        color="Work Type",
-                        color_discrete_map={
-                            "Remote": "#1f77b4",
-                            "Hybrid": "#ff7f0e",
-                            "On-site": "#2ca02c"
-                        }
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(_remote_work_fig(remote_df, job_role), use_container_width=True)
                     
                     # Add insights
                     # For the trend text, we'll use a descriptive phrase based on the 'trend' value
                     trend_text = "an increasing" if talent_data['remote_availability']['trend'] == "increasing" else "a stable"
                     st.info(f"💡 **Insight:** {talent_data['remote_availability']['remote_percentage']}% of {job_role} professionals prefer fully remote roles, with {trend_text} trend in remote work preferences.")
-        
-    with tabs[1]:
+
+        persist_achievements()
+
+    @st.fragment
+    def _render_industry_tab():
+        """Render the industry hiring trends filters, charts and insights"""
         # Industry Hiring Trends from loaded company data
         st.subheader("Industry Hiring Trends Analysis")
         st.write("Analyze hiring trends based on company data from the companies database.")
         
         # Load company data
         with st.spinner("Loading company data..."):
-            companies_data = load_companies_data()
+            companies_data = _companies_data()
             
             if not companies_data:
                 st.error("No company data found. Please make sure the companies data file is available.")
             else:
                 st.success(f"Loaded data for {len(companies_data)} companies across multiple industries.")
                 
-                # Get unique industries
-                industries = sorted(list(set([company.get("industry") for company in companies_data if company.get("industry")])))
+                # Get unique industries, recomputed only when the cached company split is reloaded
+                companies_df = _companies_df()
+                companies_by_industry = _companies_by_industry()
+                industry_options = st.session_state.get('industry_options')
+                if industry_options is None or industry_options['source'] is not companies_by_industry:
+                    st.session_state.industry_options = {
+                        'source': companies_by_industry,
+                        'options': ["All Industries"] + _industry_options()
+                    }
                 
                 # Industry filter
                 # Store the previous industry
@@ -1511,7 +1806,7 @@ elif st.session_state.current_view == "talent":
                 
                 selected_industry = st.selectbox(
                     "Select an industry to analyze:",
-                    options=["All Industries"] + industries
+                    options=st.session_state.industry_options['options']
                 )
                 
                 # Check if industry changed and update achievement
@@ -1536,41 +1831,30 @@ elif st.session_state.current_view == "talent":
                     options=priorities
                 )
                 
-                # Apply filters
-                if selected_industry != "All Industries" and selected_priority != "All Priorities":
-                    filtered_companies = [c for c in companies_data if c.get("industry") == selected_industry and c.get("priority") == selected_priority]
-                elif selected_industry != "All Industries":
-                    filtered_companies = [c for c in companies_data if c.get("industry") == selected_industry]
-                elif selected_priority != "All Priorities":
-                    filtered_companies = [c for c in companies_data if c.get("priority") == selected_priority]
-                else:
-                    filtered_companies = companies_data
+                # Apply filters: look up the industry's precomputed slice, then mask by priority
+                filtered_companies = companies_df
+                if selected_industry != "All Industries":
+                    filtered_companies = _companies_by_industry().get(selected_industry, companies_df.iloc[:0])
+                if selected_priority != "All Priorities":
+                    filtered_companies = filtered_companies[filtered_companies["priority"].eq(selected_priority)]
                 
                 # Display filtering results
                 st.write(f"Showing data for {len(filtered_companies)} companies")
                 
                 # Get industry trends
                 with st.spinner("Analyzing industry hiring trends..."):
-                    industry_trends = get_industry_hiring_trends()
+                    industry_trends = _industry_hiring_trends()
                     
-                    # Generate processed data for deeper analysis
-                    if 'real_time_job_data' in st.session_state:
-                        processed_data = process_job_data(st.session_state.real_time_job_data)
-                    else:
+                    def _processed_job_data():
+                        """Processed job data for deeper analysis, built only when a single industry is shown"""
+                        if 'real_time_job_data' in st.session_state:
+                            return process_job_data(st.session_state.real_time_job_data)
                         # Create simulated processed data for demo use
-                        processed_data = {
-                            "companies": [company.get("name") for company in companies_data if company.get("name")],
-                            "hiring_velocity": industry_trends.get(selected_industry, {}).get("hiring_velocity", []),
-                            "roles_by_company": {company.get("name"): {"Software Engineer": 5, "Data Scientist": 3} for company in companies_data if company.get("name")},
-                            "skills_by_company": {company.get("name"): {"Python": 4, "JavaScript": 3, "Cloud": 2} for company in companies_data if company.get("name")},
-                            "locations_by_company": {company.get("name"): {"San Francisco": 3, "New York": 2, "Remote": 5} for company in companies_data if company.get("name")}
-                        }
-                    
-                    # Get industry-specific insights from analyzer
-                    industry_insights = analyze_industry_trends(processed_data, companies_data)
-                    
-                    # Generate industry-specific recommendations
-                    industry_recommendations = generate_industry_recommendations(industry_insights)
+                        company_names = companies_df["name"]
+                        return _demo_processed_data(
+                            tuple(company_names[company_names.notna() & company_names.ne("")]),
+                            industry_trends.get(selected_industry, {}).get("hiring_velocity", [])
+                        )
                     
                     if selected_industry != "All Industries" and selected_industry in industry_trends:
                         # Show just the selected industry
@@ -1586,15 +1870,17 @@ elif st.session_state.current_view == "talent":
                             st.metric("Growth Rate", f"{industry_data['growth_rate']}%")
                         
                         # Add tabs for different industry insights
+                        # Insights are only needed for a single industry; analyze_industry_trends memoizes them,
+                        # and the recommendations are a cheap pass over the first insight of each type
+                        industry_insights = analyze_industry_trends(_processed_job_data(), companies_data)
+                        industry_recommendations = generate_industry_recommendations(industry_insights)
+                        
                         industry_tabs = st.tabs(["Roles & Skills", "Industry Insights", "Strategic Recommendations"])
                         
                         with industry_tabs[0]:
                             # Top roles in industry
                             st.subheader(f"Top Roles in {selected_industry}")
                             
-                            # Convert to DataFrame for visualization
-                            roles_df = pd.DataFrame(industry_data["top_roles"])
-                            
                         with industry_tabs[1]:
                             st.subheader(f"Industry-Specific Insights for {selected_industry}")
                             
@@ -1672,39 +1958,20 @@ elif st.session_state.current_view == "talent":
                             else:
                                 st.info(f"No specific recommendations available for the {selected_industry} industry yet.")
                         
-                        # Create a horizontal bar chart
-                        fig = px.bar(
-                            roles_df,
-                            y="role",
-                            x="count",
-                            color="growth",
-                            orientation='h',
-                            title=f"Most In-Demand Roles in {selected_industry}",
-                            labels={"role": "Role", "count": "Open Positions", "growth": "YoY Growth (%)"},
-                            color_continuous_scale="Viridis",
-                        )
+                        # Role and skill charts are built once per industry while the trend data is unchanged
+                        figures = industry_figures(industry_trends, ("industry", selected_industry), lambda: {
+                            "roles": _industry_roles_fig(pd.DataFrame(industry_data["top_roles"]), selected_industry),
+                            "skills": _industry_skills_fig(pd.DataFrame(industry_data["skill_demand"]), selected_industry)
+                        })
                         
-                        st.plotly_chart(fig, use_container_width=True)
+                        # Horizontal bar chart of roles
+                        st.plotly_chart(figures["roles"], use_container_width=True)
                         
                         # Skill demand in industry
                         st.subheader(f"Skill Demand in {selected_industry}")
                         
-                        # Convert to DataFrame for visualization
-                        skills_df = pd.DataFrame(industry_data["skill_demand"])
-                        
-                        # Create a horizontal bar chart
-                        fig = px.bar(
-                            skills_df,
-                            y="skill",
-                            x="demand_score",
-                            color="growth",
-                            orientation='h',
-                            title=f"Most In-Demand Skills in {selected_industry}",
-                            labels={"skill": "Skill", "demand_score": "Demand Score", "growth": "YoY Growth (%)"},
-                            color_continuous_scale="Viridis",
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
+                        # Horizontal bar chart of skills
+                        st.plotly_chart(figures["skills"], use_container_width=True)
                         
                         # Top hiring companies
                         st.subheader("Top Hiring Companies")
@@ -1717,68 +1984,54 @@ elif st.session_state.current_view == "talent":
                         # Show comparison across industries
                         st.subheader("Industry Comparison")
                         
-                        # Prepare data for charts
-                        industry_names = []
-                        hiring_velocities = []
-                        growth_rates = []
-                        company_counts = []
-                        
-                        for industry, data in industry_trends.items():
-                            industry_names.append(industry)
-                            hiring_velocities.append(data["hiring_velocity"])
-                            growth_rates.append(data["growth_rate"])
-                            company_counts.append(data["total_companies"])
+                        def comparison_figures():
+                            # Create a DataFrame for industry comparison, one column per metric
+                            industry_df = pd.DataFrame({
+                                "Industry": list(industry_trends),
+                                "Hiring Velocity": [data["hiring_velocity"] for data in industry_trends.values()],
+                                "Growth Rate": [data["growth_rate"] for data in industry_trends.values()],
+                                "Companies": [data["total_companies"] for data in industry_trends.values()]
+                            })
+                            return {
+                                "velocity": _industry_comparison_fig(industry_df, "Hiring Velocity", "Hiring Velocity by Industry"),
+                                "growth": _industry_comparison_fig(industry_df, "Growth Rate", "Hiring Growth Rate by Industry"),
+                                "companies": _industry_companies_fig(industry_df)
+                            }
                         
-                        # Create a DataFrame for industry comparison
-                        industry_df = pd.DataFrame({
-                            "Industry": industry_names,
-                            "Hiring Velocity": hiring_velocities,
-                            "Growth Rate": growth_rates,
-                            "Companies": company_counts
-                        })
+                        # The comparison doesn't depend on the filters, so it is built once while the trend data is unchanged
+                        figures = industry_figures(industry_trends, ("comparison",), comparison_figures)
                         
                         # Create charts
                         col1, col2 = st.columns(2)
                         
                         with col1:
                             # Hiring velocity chart
-                            fig = px.bar(
-                                industry_df,
-                                y="Industry",
-                                x="Hiring Velocity",
-                                orientation='h',
-                                title="Hiring Velocity by Industry",
-                                color="Hiring Velocity",
-                                color_continuous_scale="Viridis",
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
+                            st.plotly_chart(figures["velocity"], use_container_width=True)
                         
                         with col2:
                             # Growth rate chart
-                            fig = px.bar(
-                                industry_df,
-                                y="Industry",
-                                x="Growth Rate",
-                                orientation='h',
-                                title="Hiring Growth Rate by Industry",
-                                color="Growth Rate",
-                                color_continuous_scale="Viridis",
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
+                            st.plotly_chart(figures["growth"], use_container_width=True)
                         
                         # Company breakdown
                         st.subheader("Company Breakdown by Industry")
-                        fig = px.pie(
-                            industry_df,
-                            values="Companies",
-                            names="Industry",
-                            title="Distribution of Companies by Industry"
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(figures["companies"], use_container_width=True)
                     
-                # Display raw company data
+                # Display raw company data, capped so large filters don't serialize every row
                 with st.expander("View Raw Company Data"):
-                    st.dataframe(filtered_companies)
+                    st.dataframe(filtered_companies.head(RAW_COMPANY_ROW_LIMIT), use_container_width=True)
+                    if len(filtered_companies) > RAW_COMPANY_ROW_LIMIT:
+                        st.caption(f"Showing the first {RAW_COMPANY_ROW_LIMIT} of {len(filtered_companies)} companies.")
+        
+        persist_achievements()
+    
+    # Industry analysis option
+    tabs = st.tabs(["Job Role Analysis", "Industry Hiring Trends"])
+    
+    with tabs[0]:
+        _render_talent_tab()
+    
+    with tabs[1]:
+        _render_industry_tab()
     # End of talent analysis functionality
 
 # Gamification view
@@ -1901,18 +2154,14 @@ elif st.session_state.current_view == "gamification":
             st.markdown("### 🎯 Quick Win Challenge")
             st.markdown("**Track 5 companies in the same industry**")
             st.caption("Unlock: Company Tracker - Intermediate Badge")
-            if st.button("Begin Challenge", key="challenge1"):
-                st.session_state.current_view = "company"
-                st.rerun()
+            st.button("Begin Challenge", key="challenge1", on_click=change_view, args=("company",))
     
     with challenge2:
         with st.container(border=True):
             st.markdown("### 🏆 Advanced Challenge")
             st.markdown("**Analyze talent availability in 3 different cities**")
             st.caption("Unlock: Talent Scout - Intermediate Badge")
-            if st.button("Begin Challenge", key="challenge2"):
-                st.session_state.current_view = "talent"
-                st.rerun()
+            st.button("Begin Challenge", key="challenge2", on_click=change_view, args=("talent",))
     
     # Recent achievements
     st.subheader("Recent Achievements")
@@ -1980,6 +2229,7 @@ elif st.session_state.current_view == "settings":
     with col1:
         if st.button("Clear All Watched Companies"):
             st.session_state.watched_companies = []
+            st.session_state.watched_companies_set = set()
             # In a real app, we would also clear this from the database
             st.success("Watchlist cleared!")
     
@@ -1997,8 +2247,12 @@ elif st.session_state.current_view == "settings":
                 'alert_threshold': 20
             }
             st.session_state.watched_companies = []
+            st.session_state.watched_companies_set = set()
             st.session_state.last_update = None
-            st.session_state.current_view = "dashboard"
+            save_achievements(DEFAULT_ACHIEVEMENTS)
             
             st.success("Application data reset!")
             st.rerun()
+
+# Persist achievements changed during this run
+persist_achievements()
@@ -12,6 +12,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Use orjson for the JSON stored in the database when it is installed
+try:
+    import orjson
+    
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 # Database configuration
 DB_FILE = "hiring_intelligence.db"
 
@@ -118,6 +130,40 @@ def save_company_to_watch(company_name: str) -> bool:
         logger.error(f"Error saving company to watch: {str(e)}")
         return False
 
+def save_companies_to_watch(company_names: List[str]) -> List[str]:
+    """
+    Add several companies to the watchlist in a single transaction.
+    
+    Args:
+        company_names: Names of the companies to watch
+    
+    Returns:
+        Names of the companies that were newly added, in input order
+    """
+    try:
+        # Drop duplicates while keeping the caller's order
+        company_names = list(dict.fromkeys(company_names))
+        if not company_names:
+            return []
+        
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        placeholders = ", ".join("?" * len(company_names))
+        cursor.execute(f"SELECT name FROM watched_companies WHERE name IN ({placeholders})", company_names)
+        existing = {row["name"] for row in cursor.fetchall()}
+        
+        added = [name for name in company_names if name not in existing]
+        cursor.executemany("INSERT OR IGNORE INTO watched_companies (name) VALUES (?)", [(name,) for name in added])
+        conn.commit()
+        conn.close()
+        
+        return added
+    
+    except Exception as e:
+        logger.error(f"Error saving companies to watch: {str(e)}")
+        return []
+
 def get_watched_companies() -> List[str]:
     """
     Get the list of companies being watched.
@@ -206,7 +252,7 @@ def save_job_listings(company_name: str, job_listings: List[Dict[str, Any]]) ->
         # Insert job listings
         for job in job_listings:
             # Convert requirements list to JSON string
-            requirements_json = json.dumps(job.get("requirements", []))
+            requirements_json = _json_dumps(job.get("requirements", []))
             
             cursor.execute('''
             INSERT INTO job_listings 
@@ -280,7 +326,7 @@ def get_job_listings(company_name: Optional[str] = None, days: int = 30) -> List
             
             # Convert JSON string back to list
             try:
-                job_dict["requirements"] = json.loads(job_dict["requirements"])
+                job_dict["requirements"] = _json_loads(job_dict["requirements"])
             except:
                 job_dict["requirements"] = []
             
@@ -309,7 +355,7 @@ def save_insight(insight_type: str, insight_text: str, data: Dict[str, Any]) ->
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        data_json = json.dumps(data)
+        data_json = _json_dumps(data)
         
         cursor.execute('''
         INSERT INTO insights (type, insight_text, data)
@@ -357,7 +403,7 @@ def get_insights(insight_type: Optional[str] = None, limit: int = 100) -> List[D
             
             # Convert JSON string back to dictionary
             try:
-                insight_dict["data"] = json.loads(insight_dict["data"])
+                insight_dict["data"] = _json_loads(insight_dict["data"])
             except:
                 insight_dict["data"] = {}
             
@@ -387,7 +433,7 @@ def save_user_setting(setting_name: str, setting_value: Any) -> bool:
         
         # Convert value to JSON string
         if not isinstance(setting_value, str):
-            setting_value = json.dumps(setting_value)
+            setting_value = _json_dumps(setting_value)
         
         cursor.execute('''
         INSERT OR REPLACE INTO user_settings (setting_name, setting_value)
@@ -427,7 +473,7 @@ def get_user_setting(setting_name: str, default_value: Any = None) -> Any:
             
             # Try to parse as JSON
             try:
-                return json.loads(setting_value)
+                return _json_loads(setting_value)
             except:
                 return setting_value
         else:
@@ -436,3 +482,25 @@ def get_user_setting(setting_name: str, default_value: Any = None) -> Any:
     except Exception as e:
         logger.error(f"Error getting user setting: {str(e)}")
         return default_value
+
+def save_achievements(achievements: Dict[str, Any]) -> bool:
+    """
+    Save the gamification achievements to the database.
+    
+    Args:
+        achievements: Achievements keyed by achievement id, with their levels and progress
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    return save_user_setting("achievements", achievements)
+
+def load_achievements() -> Optional[Dict[str, Any]]:
+    """
+    Load the saved gamification achievements from the database.
+    
+    Returns:
+        Achievements keyed by achievement id, or None if none have been saved
+    """
+    achievements = get_user_setting("achievements")
+    return achievements if isinstance(achievements, dict) else None
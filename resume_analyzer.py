@@ -1,6 +1,34 @@
 import re
 import pandas as pd
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
+
+def extract_pdf_text(pdf_bytes: bytes, max_chars: int = 50000) -> Optional[str]:
+    """
+    Extract the plain text of a PDF resume using PyMuPDF.
+    
+    Args:
+        pdf_bytes: Raw bytes of the PDF file
+        max_chars: Stop reading further pages once this much text has been extracted
+    
+    Returns:
+        Text of the PDF pages, or None if PyMuPDF is not installed
+    """
+    try:
+        import pymupdf
+    except ImportError:
+        return None
+    
+    # Read pages lazily; resumes are short, so oversized documents are cut off early
+    pages = []
+    total_chars = 0
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for page in doc:
+            pages.append(page.get_text("text"))
+            total_chars += len(pages[-1])
+            if total_chars >= max_chars:
+                break
+    
+    return "\n".join(pages)
 
 def extract_resume_content(resume_text: str) -> Dict[str, Any]:
     """
@@ -83,20 +111,23 @@ def extract_resume_content(resume_text: str) -> Dict[str, Any]:
             resume_data["summary"] = line.strip()
             break
     
-    # Find skills in resume
+    # Find skills in resume, tracking lowercased names seen so far for case-insensitive de-duplication
+    seen_skills = set()
     for pattern in skills_patterns:
         matches = re.findall(pattern, resume_text, re.IGNORECASE)
         for match in matches:
-            if match.lower() not in [s.lower() for s in resume_data["skills"]]:
+            if match.lower() not in seen_skills:
+                seen_skills.add(match.lower())
                 resume_data["skills"].append(match)
     
     # Additional skill extraction from lists and bullets
     bullet_skills = re.findall(r'[•\-\*]\s*([A-Za-z0-9][\w\s\-\/\&\+\#\.]+)', resume_text)
     for skill in bullet_skills:
         skill = skill.strip()
-        if len(skill) > 3 and len(skill) < 30 and skill.lower() not in [s.lower() for s in resume_data["skills"]]:
+        if len(skill) > 3 and len(skill) < 30 and skill.lower() not in seen_skills:
             # Check if it's likely a skill and not part of a sentence
             if not any(word in skill.lower() for word in ["and", "the", "with", "for", "to", "in", "on"]):
+                seen_skills.add(skill.lower())
                 resume_data["skills"].append(skill)
     
     # Extract education (simplified approach)
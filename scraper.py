@@ -8,6 +8,7 @@ import logging
 import json
 import os
 from typing import List, Dict, Any, Optional
+from utils import records_to_columns
 
 # Configure logging
 logging.basicConfig(
@@ -277,7 +278,8 @@ def get_industry_hiring_trends() -> Dict[str, Any]:
     Analyze hiring trends across different industries.
     
     Returns:
-        Dictionary with industry-based hiring trend data
+        Dictionary with industry-based hiring trend data; top roles and skill
+        demand are column-oriented dictionaries of lists
     """
     companies = load_companies_data()
     
@@ -297,8 +299,8 @@ def get_industry_hiring_trends() -> Dict[str, Any]:
             "total_companies": len(industry_companies),
             "hiring_velocity": random.randint(5, 25),  # Average new jobs per week
             "top_hiring_companies": random.sample(industry_companies, min(3, len(industry_companies))),
-            "top_roles": _generate_top_roles_for_industry(industry),
-            "skill_demand": _generate_skill_demand_for_industry(industry),
+            "top_roles": records_to_columns(_generate_top_roles_for_industry(industry)),
+            "skill_demand": records_to_columns(_generate_skill_demand_for_industry(industry)),
             "growth_rate": round(random.uniform(2.0, 15.0), 1)  # % growth in hiring
         }
     
@@ -2,6 +2,26 @@ import re
 import json
 from typing import Dict, List, Any, Tuple
 import pandas as pd
+from functools import lru_cache
+from utils import records_to_columns
+
+# Keywords that place a job role in a talent category, checked in order
+ROLE_CATEGORY_TERMS = (
+    ("tech", ("software", "developer", "engineer", "data", "programmer", "devops")),
+    ("marketing", ("marketing", "sales", "content", "seo", "social media", "business")),
+    ("design", ("design", "ux", "ui", "graphic", "creative", "artist")),
+)
+
+@lru_cache(maxsize=256)
+def _role_category(job_role: str) -> str:
+    """
+    Classify a job role as tech, marketing, design, or general, once per distinct role.
+    """
+    role = job_role.lower()
+    for category, terms in ROLE_CATEGORY_TERMS:
+        if any(term in role for term in terms):
+            return category
+    return "general"
 
 def analyze_talent_availability(job_role: str, location: str, skills: List[str]) -> Dict[str, Any]:
     """
@@ -13,7 +33,9 @@ def analyze_talent_availability(job_role: str, location: str, skills: List[str])
         skills: List of required skills
         
     Returns:
-        Dictionary with talent availability insights
+        Dictionary with talent availability insights; the tabular breakdowns
+        (cities, skills, competitors, education, experience) are column-oriented
+        dictionaries of lists
     """
     # In a real application, this would call APIs for LinkedIn, Indeed, Glassdoor, etc.
     # For this demo, we'll return sample data based on the inputs
@@ -21,12 +43,12 @@ def analyze_talent_availability(job_role: str, location: str, skills: List[str])
     # Calculate availability based on role and location
     availability_data = {
         "total_candidates": calculate_candidate_estimate(job_role, location),
-        "top_cities": get_top_cities_for_talent(job_role, skills),
-        "skill_prevalence": get_skill_prevalence(job_role, skills),
+        "top_cities": records_to_columns(get_top_cities_for_talent(job_role, skills)),
+        "skill_prevalence": records_to_columns(get_skill_prevalence(job_role, skills)),
         "talent_growth_rate": calculate_talent_growth_rate(job_role, location),
-        "competing_companies": get_competing_companies(job_role, location),
-        "education_breakdown": get_education_breakdown(job_role),
-        "experience_levels": get_experience_distribution(job_role, location),
+        "competing_companies": records_to_columns(get_competing_companies(job_role, location)),
+        "education_breakdown": records_to_columns(get_education_breakdown(job_role)),
+        "experience_levels": records_to_columns(get_experience_distribution(job_role, location)),
         "remote_availability": calculate_remote_availability(job_role, skills)
     }
     
@@ -130,11 +152,12 @@ def get_top_cities_for_talent(job_role: str, skills: List[str]) -> List[Dict[str
     ]
     
     # Determine which city list to use based on job role
-    if any(tech_term in job_role.lower() for tech_term in ["software", "developer", "engineer", "data", "programmer", "devops"]):
+    category = _role_category(job_role)
+    if category == "tech":
         cities = tech_cities
-    elif any(marketing_term in job_role.lower() for marketing_term in ["marketing", "sales", "content", "seo", "social media", "business"]):
+    elif category == "marketing":
         cities = marketing_cities
-    elif any(design_term in job_role.lower() for design_term in ["design", "ux", "ui", "graphic", "creative", "artist"]):
+    elif category == "design":
         cities = design_cities
     else:
         # Use average of all lists as default
@@ -228,11 +251,12 @@ def get_skill_prevalence(job_role: str, skills: List[str]) -> List[Dict[str, Any
     }
     
     # Determine which skill prevalence map to use
-    if any(tech_term in job_role.lower() for tech_term in ["software", "developer", "engineer", "data", "programmer", "devops"]):
+    category = _role_category(job_role)
+    if category == "tech":
         skill_prevalence_map = tech_skills_prevalence
-    elif any(marketing_term in job_role.lower() for marketing_term in ["marketing", "sales", "content", "seo", "social media", "business"]):
+    elif category == "marketing":
         skill_prevalence_map = marketing_skills_prevalence
-    elif any(design_term in job_role.lower() for design_term in ["design", "ux", "ui", "graphic", "creative", "artist"]):
+    elif category == "design":
         skill_prevalence_map = design_skills_prevalence
     else:
         # Combine all maps for general roles
@@ -284,11 +308,12 @@ def calculate_talent_growth_rate(job_role: str, location: str) -> Dict[str, Any]
     low_growth_locations = ["detroit", "cleveland", "pittsburgh", "st. louis", "philadelphia"]
     
     # Determine base growth rate by role
-    if any(tech_term in job_role.lower() for tech_term in ["software", "developer", "engineer", "data", "programmer", "devops"]):
+    category = _role_category(job_role)
+    if category == "tech":
         base_growth = tech_growth
-    elif any(marketing_term in job_role.lower() for marketing_term in ["marketing", "sales", "content", "seo", "social media", "business"]):
+    elif category == "marketing":
         base_growth = marketing_growth
-    elif any(design_term in job_role.lower() for design_term in ["design", "ux", "ui", "graphic", "creative", "artist"]):
+    elif category == "design":
         base_growth = design_growth
     else:
         base_growth = general_growth
@@ -374,11 +399,12 @@ def get_competing_companies(job_role: str, location: str) -> List[Dict[str, Any]
     ]
     
     # Determine which company list to use
-    if any(tech_term in job_role.lower() for tech_term in ["software", "developer", "engineer", "data", "programmer", "devops"]):
+    category = _role_category(job_role)
+    if category == "tech":
         companies = tech_companies
-    elif any(marketing_term in job_role.lower() for marketing_term in ["marketing", "sales", "content", "seo", "social media", "business"]):
+    elif category == "marketing":
         companies = marketing_companies
-    elif any(design_term in job_role.lower() for design_term in ["design", "ux", "ui", "graphic", "creative", "artist"]):
+    elif category == "design":
         companies = design_companies
     else:
         # Take a mix of companies from different lists
@@ -423,11 +449,12 @@ def get_education_breakdown(job_role: str) -> List[Dict[str, Any]]:
     ]
     
     # Determine which education breakdown to use
-    if any(tech_term in job_role.lower() for tech_term in ["software", "developer", "engineer", "data", "programmer", "devops"]):
+    category = _role_category(job_role)
+    if category == "tech":
         return tech_education
-    elif any(marketing_term in job_role.lower() for marketing_term in ["marketing", "sales", "content", "seo", "social media", "business"]):
+    elif category == "marketing":
         return marketing_education
-    elif any(design_term in job_role.lower() for design_term in ["design", "ux", "ui", "graphic", "creative", "artist"]):
+    elif category == "design":
         return design_education
     else:
         return general_education
@@ -469,11 +496,12 @@ def get_experience_distribution(job_role: str, location: str) -> List[Dict[str,
     tech_hubs = ["san francisco", "new york", "seattle", "boston"]
     
     # Determine which experience distribution to use
-    if any(tech_term in job_role.lower() for tech_term in ["software", "developer", "engineer", "data", "programmer", "devops"]):
+    category = _role_category(job_role)
+    if category == "tech":
         experience_dist = tech_experience.copy()
-    elif any(marketing_term in job_role.lower() for marketing_term in ["marketing", "sales", "content", "seo", "social media", "business"]):
+    elif category == "marketing":
         experience_dist = marketing_experience.copy()
-    elif any(design_term in job_role.lower() for design_term in ["design", "ux", "ui", "graphic", "creative", "artist"]):
+    elif category == "design":
         experience_dist = design_experience.copy()
     else:
         experience_dist = general_experience.copy()
@@ -521,11 +549,12 @@ def calculate_remote_availability(job_role: str, skills: List[str]) -> Dict[str,
     }
     
     # Determine base remote work tendency
-    if any(tech_term in job_role.lower() for tech_term in ["software", "developer", "engineer", "data", "programmer", "devops"]):
+    category = _role_category(job_role)
+    if category == "tech":
         remote_tendency = dict(tech_remote)
-    elif any(marketing_term in job_role.lower() for marketing_term in ["marketing", "sales", "content", "seo", "social media", "business"]):
+    elif category == "marketing":
         remote_tendency = dict(marketing_remote)
-    elif any(design_term in job_role.lower() for design_term in ["design", "ux", "ui", "graphic", "creative", "artist"]):
+    elif category == "design":
         remote_tendency = dict(design_remote)
     else:
         remote_tendency = dict(general_remote)
@@ -536,3 +536,21 @@ def calculate_percentage_change(current: float, previous: float) -> float:
         return 100.0 if current > 0 else 0.0
     
     return ((current - previous) / previous) * 100
+
+def records_to_columns(records: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Convert a list of row dictionaries into a dictionary of column lists.
+    
+    Column-oriented data lets pandas build each DataFrame column directly
+    instead of assembling rows and consolidating them afterwards.
+    
+    Args:
+        records: Row dictionaries that all share the same keys
+    
+    Returns:
+        Dictionary mapping each key to the list of its values, in row order
+    """
+    if not records:
+        return {}
+    
+    return {key: [record[key] for record in records] for key in records[0]}